@@ -1,5 +1,6 @@
 """Domain models for trading positions and related business logic."""
+from python_trading_objects.domain.position_book import PositionBook
 from python_trading_objects.domain.position_calculator import PositionCalculator
 from python_trading_objects.domain.trading_position import TradingPosition
 
-__all__ = ['TradingPosition', 'PositionCalculator']
+__all__ = ['TradingPosition', 'PositionCalculator', 'PositionBook']
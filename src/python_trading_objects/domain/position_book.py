@@ -0,0 +1,260 @@
+"""Columnar container for the open positions of a single pair"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, Iterator, List, Set, Tuple, TypeVar
+
+from python_trading_objects.domain.trading_position import trail_factor
+from python_trading_objects.quotes.price import Price
+
+_T = TypeVar("_T")
+
+if TYPE_CHECKING:
+    from python_trading_objects.domain.trading_position import TradingPosition
+    from python_trading_objects.quotes.pair import BotPair
+
+
+class PositionBook:
+    """
+    Positions of one pair stored with parallel amount columns.
+
+    The token amounts, cost basis and trigger prices of every position are
+    kept in private Decimal lists, updated on add/remove, so PositionCalculator
+    and the per-tick scans can work on them directly instead of reading each
+    position's attributes on every call. They are exposed read-only as tuples
+    (tokens, costs, sale_prices, dca_prices).
+
+    Trailing stops update the expected sale price column in place; the
+    matching TradingPosition objects are only rebuilt when they are read.
+
+    `version` is incremented by every mutation made through the book's
+    methods; results memoized on the book with memoize() (see
+    PositionCalculator.aggregate_roi) are dropped at the same time.
+    """
+
+    __slots__ = (
+        "pair",
+        "version",
+        "_tokens",
+        "_costs",
+        "_sale_prices",
+        "_dca_prices",
+        "_positions",
+        "_index",
+        "_stale",
+        "_memo",
+    )
+
+    def __init__(self, pair: BotPair, positions: Iterable[TradingPosition] = ()):
+        """
+        Create a book for a pair.
+
+        Args:
+            pair: Pair shared by all positions of the book
+            positions: Initial positions
+        """
+        self.pair = pair
+        self._tokens: List[Decimal] = []
+        self._costs: List[Decimal] = []
+        self._sale_prices: List[Decimal] = []
+        self._dca_prices: List[Decimal] = []
+        self._positions: List[TradingPosition] = []
+        self._index: Dict[str, int] = {}
+        # Rows whose sale price column is newer than the stored position
+        self._stale: Set[int] = set()
+        self.version = 0
+        # Results computed from the columns, valid for the current version
+        self._memo: Dict[Any, Any] = {}
+        for position in positions:
+            self.add(position)
+
+    def add(self, position: TradingPosition) -> None:
+        """
+        Add a position to the book.
+
+        Args:
+            position: Position on the book's pair
+
+        Raises:
+            ValueError: If the pair differs or the id is already in the book
+        """
+        if position.pair.pair != self.pair.pair:
+            raise ValueError(f"Cannot add a {position.pair.pair} position to a {self.pair.pair} book")
+        if position.id in self._index:
+            raise ValueError(f"Position {position.id} is already in the book")
+        self._touch()
+        self._index[position.id] = len(self._positions)
+        self._positions.append(position)
+        self._tokens.append(position.number_of_tokens.amount)
+        self._costs.append(position.cost_basis.amount)
+        self._sale_prices.append(position.expected_sale_price.price)
+        self._dca_prices.append(position.next_purchase_price.price)
+
+    def remove(self, position_id: str) -> TradingPosition:
+        """
+        Remove a position from the book.
+
+        The last position takes the freed slot, so removal is O(1) and the
+        order of the remaining positions is not preserved.
+
+        Args:
+            position_id: Id of the position to remove
+
+        Returns:
+            The removed position
+
+        Raises:
+            KeyError: If no position has this id
+        """
+        index = self._index.pop(position_id)
+        self._touch()
+        removed = self._materialize(index)
+        last = len(self._positions) - 1
+        if index != last:
+            if last in self._stale:
+                self._stale.discard(last)
+                self._stale.add(index)
+            moved = self._positions[last]
+            self._positions[index] = moved
+            self._tokens[index] = self._tokens[last]
+            self._costs[index] = self._costs[last]
+            self._sale_prices[index] = self._sale_prices[last]
+            self._dca_prices[index] = self._dca_prices[last]
+            self._index[moved.id] = index
+        self._positions.pop()
+        self._tokens.pop()
+        self._costs.pop()
+        self._sale_prices.pop()
+        self._dca_prices.pop()
+        return removed
+
+    def sell_candidates(self, current_price: Price) -> List[int]:
+        """
+        Indexes of the positions whose sell condition is met.
+
+        Same rule as TradingPosition.should_sell_at, evaluated on the
+        expected sale price column in one pass.
+
+        Args:
+            current_price: Current market price
+
+        Returns:
+            Row indexes (use book[i] to get the position)
+        """
+        price = current_price.price
+        return [i for i, target in enumerate(self._sale_prices) if price >= target]
+
+    def dca_candidates(self, current_price: Price) -> List[int]:
+        """
+        Indexes of the positions whose DCA buy condition is met.
+
+        Same rule as TradingPosition.should_buy_dca_at, evaluated on the
+        next purchase price column in one pass.
+
+        Args:
+            current_price: Current market price
+
+        Returns:
+            Row indexes (use book[i] to get the position)
+        """
+        price = current_price.price
+        return [i for i, target in enumerate(self._dca_prices) if price <= target]
+
+    def apply_trailing_stop(self, current_price: Price, trail_pct: float) -> List[int]:
+        """
+        Apply TradingPosition.apply_trailing_stop to every position of the book.
+
+        The new expected sale price is computed once and compared with the
+        sale price column; positions are not cloned until they are read.
+
+        Args:
+            current_price: Current market price
+            trail_pct: Trailing percentage (e.g., 0.02 for 2%)
+
+        Returns:
+            Row indexes whose expected sale price was raised
+        """
+        new_expected = current_price.price * trail_factor(trail_pct)
+        sale_prices = self._sale_prices
+        updated = [i for i, target in enumerate(sale_prices) if new_expected > target]
+        for i in updated:
+            sale_prices[i] = new_expected
+        if updated:
+            self._stale.update(updated)
+            self._touch()
+        return updated
+
+    @property
+    def tokens(self) -> Tuple[Decimal, ...]:
+        """Token amount of every position, in row order"""
+        return tuple(self._tokens)
+
+    @property
+    def costs(self) -> Tuple[Decimal, ...]:
+        """Cost basis amount of every position, in row order"""
+        return tuple(self._costs)
+
+    @property
+    def sale_prices(self) -> Tuple[Decimal, ...]:
+        """Expected sale price of every position, in row order"""
+        return tuple(self._sale_prices)
+
+    @property
+    def dca_prices(self) -> Tuple[Decimal, ...]:
+        """Next purchase price of every position, in row order"""
+        return tuple(self._dca_prices)
+
+    def snapshot(self) -> List[TradingPosition]:
+        """Return the positions of the book, reflecting every trailing stop applied"""
+        return [self._materialize(i) for i in range(len(self._positions))]
+
+    def memoize(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """
+        Return a result computed from the book, cached until its next mutation.
+
+        Args:
+            key: Identifies the result (include every input besides the book)
+            compute: Called on a cache miss to produce the result
+
+        Returns:
+            The cached or newly computed result
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+    def _touch(self) -> None:
+        """Record a mutation: bump the version and drop memoized results"""
+        self.version += 1
+        self._memo.clear()
+
+    def _materialize(self, index: int) -> TradingPosition:
+        """Return the position at a row, rebuilding it if its sale price changed"""
+        position = self._positions[index]
+        if index in self._stale:
+            self._stale.discard(index)
+            expected = position.expected_sale_price
+            position = position.adjust_expected_sale_price(
+                Price._fast_new(self._sale_prices[index], expected.base_symbol, expected.quote_symbol)
+            )
+            self._positions[index] = position
+        return position
+
+    def get(self, position_id: str) -> TradingPosition:
+        """Return the position with the given id (KeyError if absent)"""
+        return self._materialize(self._index[position_id])
+
+    def __contains__(self, position_id: object) -> bool:
+        return position_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, index: int) -> TradingPosition:
+        return self._materialize(range(len(self._positions))[index])
+
+    def __iter__(self) -> Iterator[TradingPosition]:
+        return iter(self.snapshot())
@@ -1,83 +1,124 @@
 """Static helper functions for position calculations"""
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import List, TYPE_CHECKING
+from decimal import ROUND_DOWN, Decimal
+from typing import List, Sequence, Tuple, TYPE_CHECKING, Union
+
+from python_trading_objects.domain.position_book import PositionBook
+from python_trading_objects.quotes._kernels import sum_amounts
+from python_trading_objects.quotes.asset import Asset, _classify
+from python_trading_objects.quotes.price import Price
+from python_trading_objects.quotes.quote import _QUANTIZERS
 
 if TYPE_CHECKING:
     from python_trading_objects.domain.trading_position import TradingPosition
-    from python_trading_objects.quotes.asset import Asset
-    from python_trading_objects.quotes.price import Price
+
+Positions = Union[List['TradingPosition'], PositionBook]
+
+
+def _value_quantizer(quote_symbol: str) -> Decimal:
+    """
+    Quantizer applied by Price * Token for a given quote symbol.
+
+    Price * Token builds its result with Asset/USD._fast_new, which take the
+    precision from the symbol classification (never from Quote.set_precision).
+    """
+    return _QUANTIZERS[_classify(quote_symbol)[2]]
+
+
+def _extract_amounts(positions: Positions) -> Tuple[Sequence[Decimal], Sequence[Decimal]]:
+    """
+    Extract cost basis and token amounts of positions in a single pass.
+
+    Cost basis is read from TradingPosition.cost_basis, which each position
+    computes once and caches. A PositionBook already holds both columns and
+    is returned as is.
+
+    Args:
+        positions: Non-empty list (or book) of positions on the same pair
+
+    Returns:
+        Tuple (costs, tokens) of parallel Decimal sequences
+    """
+    if isinstance(positions, PositionBook):
+        return positions.costs, positions.tokens
+    costs = [pos.cost_basis.amount for pos in positions]
+    tokens = [pos.number_of_tokens.amount for pos in positions]
+    return costs, tokens
+
+
+def _gross_value(tokens: Sequence[Decimal], current_price: Price) -> Decimal:
+    """Sum of the per-position values of token amounts at the current price"""
+    quantizer = _value_quantizer(current_price.quote_symbol)
+    price = current_price.price
+    return sum_amounts((price * amount).quantize(quantizer, rounding=ROUND_DOWN) for amount in tokens)
+
+
+def _aggregate_roi(positions: Positions, current_price: Price) -> float:
+    """Aggregate ROI of a non-empty list (or book) of positions"""
+    # One extraction pass shared by the cost and value totals
+    costs, tokens = _extract_amounts(positions)
+    total_cost = sum_amounts(costs)
+    total_value = _gross_value(tokens, current_price)
+
+    if total_cost == 0:
+        return 0.0
+
+    return float(((total_value - total_cost) / total_cost) * 100)
 
 
 class PositionCalculator:
     """Static utility methods for position calculations"""
 
     @staticmethod
-    def total_value(positions: List[TradingPosition], current_price: Price) -> Asset:
+    def total_value(positions: Positions, current_price: Price) -> Asset:
         """Calculate total value of multiple positions"""
-        from python_trading_objects.quotes.asset import Asset
-
         if not positions:
             # Return zero asset with quote symbol from price
-            return Asset(0, current_price.quote_symbol, _from_factory=True)
+            return Asset.zero(current_price.quote_symbol)
 
-        total = sum(
-            pos.calculate_gross_value(current_price).amount
-            for pos in positions
-        )
-        quote_symbol = current_price.quote_symbol
-        return Asset(total, quote_symbol, _from_factory=True)
+        if isinstance(positions, PositionBook):
+            tokens = positions.tokens
+        else:
+            tokens = [pos.number_of_tokens.amount for pos in positions]
+        total = _gross_value(tokens, current_price)
+        return Asset._fast_new(total, current_price.quote_symbol)
 
     @staticmethod
-    def total_cost_basis(positions: List[TradingPosition]) -> Asset:
+    def total_cost_basis(positions: Positions) -> Asset:
         """Calculate total cost basis of positions"""
-        from python_trading_objects.quotes.asset import Asset
-
         if not positions:
-            return Asset(0, "USDT", _from_factory=True)
+            return Asset.zero("USDT")
 
-        total = sum(pos.cost_basis.amount for pos in positions)
-        quote_symbol = positions[0].pair.quote_symbol
-        return Asset(total, quote_symbol, _from_factory=True)
+        total = sum_amounts(_extract_amounts(positions)[0])
+        return Asset._fast_new(total, positions[0].pair.quote_symbol)
 
     @staticmethod
-    def weighted_average_price(positions: List[TradingPosition]) -> Price:
+    def weighted_average_price(positions: Positions) -> Price:
         """Calculate weighted average purchase price"""
-        from python_trading_objects.quotes.price import Price
-
         if not positions:
             raise ValueError("Cannot calculate average of empty positions")
 
-        total_cost = Decimal("0")
-        total_tokens = Decimal("0")
-
-        for pos in positions:
-            total_cost += pos.cost_basis.amount
-            total_tokens += pos.number_of_tokens.amount
+        costs, tokens = _extract_amounts(positions)
+        total_cost = sum_amounts(costs)
+        total_tokens = sum_amounts(tokens)
 
         if total_tokens == 0:
             raise ValueError("Cannot calculate average: total tokens is zero")
 
         avg_price = total_cost / total_tokens
         first_pos = positions[0]
-        return Price(
-            avg_price,
-            first_pos.pair.base_symbol,
-            first_pos.pair.quote_symbol,
-            _from_factory=True
-        )
+        return Price._fast_new(avg_price, first_pos.pair.base_symbol, first_pos.pair.quote_symbol)
 
     @staticmethod
-    def aggregate_roi(positions: List[TradingPosition], current_price: Price) -> float:
+    def aggregate_roi(positions: Positions, current_price: Price) -> float:
         """Calculate aggregate ROI for multiple positions"""
         if not positions:
             return 0.0
 
-        total_cost = PositionCalculator.total_cost_basis(positions).amount
-        total_value = PositionCalculator.total_value(positions, current_price).amount
-
-        if total_cost == 0:
-            return 0.0
+        if isinstance(positions, PositionBook):
+            # Memoized on the book until its next mutation
+            key = ('aggregate_roi', current_price.price, current_price.quote_symbol)
+            return positions.memoize(key, lambda: _aggregate_roi(positions, current_price))
 
-        return float(((total_value - total_cost) / total_cost) * 100)
+        return _aggregate_roi(positions, current_price)
@@ -1,8 +1,12 @@
 """Rich domain model for trading positions"""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,14 +15,43 @@ if TYPE_CHECKING:
     from python_trading_objects.quotes.coin import Token
     from python_trading_objects.quotes.asset import Asset
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
-class TradingPosition:
+
+# Fields read by to_dict, fetched in a single call
+_DICT_FIELDS = attrgetter(
+    'id', 'short_id', 'pair', 'purchase_price', 'expected_sale_price', 'next_purchase_price',
+    'number_of_tokens', 'variations', 'strategy_tag', 'timestamp', 'notes'
+)
+
+
+@lru_cache(maxsize=128, typed=True)
+def trail_factor(trail_pct: float) -> Decimal:
+    """Decimal multiplier (1 - trail_pct), memoized: strategies reuse a few trail values"""
+    return Decimal(str(1 - trail_pct))
+
+
+class _DerivedValues:
+    """
+    Storage for the values TradingPosition computes lazily.
+
+    Declared as plain slots on a base class rather than dataclass fields, so
+    they stay out of fields(), asdict(), replace() and comparisons.
+    """
+    __slots__ = ('_cost_basis', '_potential_profit', '_potential_roi')
+
+
+@dataclass(frozen=True, **_SLOTS)
+class TradingPosition(_DerivedValues):
     """
     Complete trading position with business logic.
 
     Represents a position in a trading strategy with all calculations
     and business rules for entering/exiting trades.
+
+    Positions are immutable: adjustments return a new instance, so derived
+    values (cost basis, potential profit/ROI) are computed once and cached.
     """
     # Identity
     id: str
@@ -63,9 +96,10 @@ class TradingPosition:
         Returns:
             Profit as Asset object
         """
+        # Each value is truncated before the difference, as before; the cost
+        # side comes from the cached cost basis instead of a new product
         sale_value = sale_price * self.number_of_tokens
-        cost_value = self.purchase_price * self.number_of_tokens
-        return sale_value - cost_value
+        return sale_value - self.cost_basis
 
     def calculate_gross_value(self, current_price: Price) -> Asset:
         """
@@ -82,17 +116,32 @@ class TradingPosition:
     @property
     def cost_basis(self) -> Asset:
         """Total amount invested in this position"""
-        return self.purchase_price * self.number_of_tokens
+        try:
+            return self._cost_basis
+        except AttributeError:
+            value = self.purchase_price * self.number_of_tokens
+            object.__setattr__(self, '_cost_basis', value)
+            return value
 
     @property
     def potential_profit(self) -> Asset:
         """Profit if sold at expected sale price"""
-        return self.calculate_profit(self.expected_sale_price)
+        try:
+            return self._potential_profit
+        except AttributeError:
+            value = self.calculate_profit(self.expected_sale_price)
+            object.__setattr__(self, '_potential_profit', value)
+            return value
 
     @property
     def potential_roi(self) -> float:
         """ROI if sold at expected sale price"""
-        return self.calculate_roi(self.expected_sale_price)
+        try:
+            return self._potential_roi
+        except AttributeError:
+            value = self.calculate_roi(self.expected_sale_price)
+            object.__setattr__(self, '_potential_roi', value)
+            return value
 
     # === Business Rules (Universal) ===
 
@@ -140,10 +189,8 @@ class TradingPosition:
         Returns:
             New position with updated expected sale price
         """
-        from decimal import Decimal
-
         # Keep Decimal precision throughout
-        new_expected = self.pair.create_price(current_price.price * Decimal(str(1 - trail_pct)))
+        new_expected = self.pair.create_price(current_price.price * trail_factor(trail_pct))
 
         # Only adjust if new price is higher (trailing up)
         if new_expected > self.expected_sale_price:
@@ -158,18 +205,20 @@ class TradingPosition:
         Convert to dictionary with primitives.
         Suitable for JSON serialization or event publishing.
         """
+        (position_id, short_id, pair, purchase_price, expected_sale_price, next_purchase_price,
+         number_of_tokens, variations, strategy_tag, timestamp, notes) = _DICT_FIELDS(self)
         return {
-            'id': self.id,
-            'short_id': self.short_id,
-            'pair': self.pair.pair,
-            'purchase_price': float(self.purchase_price.price),
-            'expected_sale_price': float(self.expected_sale_price.price),
-            'next_purchase_price': float(self.next_purchase_price.price),
-            'number_of_tokens': float(self.number_of_tokens.amount),
-            'variations': self.variations,
-            'strategy_tag': self.strategy_tag,
-            'timestamp': self.timestamp.isoformat(),
-            'notes': self.notes
+            'id': position_id,
+            'short_id': short_id,
+            'pair': pair.pair,
+            'purchase_price': float(purchase_price.price),
+            'expected_sale_price': float(expected_sale_price.price),
+            'next_purchase_price': float(next_purchase_price.price),
+            'number_of_tokens': float(number_of_tokens.amount),
+            'variations': variations,
+            'strategy_tag': strategy_tag,
+            'timestamp': timestamp.isoformat(),
+            'notes': notes
         }
 
     @classmethod
@@ -1,15 +1,21 @@
 from .assertion import bot_assert
+from .asset_array import AssetArray
 from .coin import Token
 from .pair import BotPair
 from .price import Price
+from .price_array import PriceArray
 from .quote import Quote
+from .token_array import TokenArray
 from .usd import USD
 
 __all__ = [
     "bot_assert",
+    "AssetArray",
     "Token",
     "BotPair",
     "Price",
+    "PriceArray",
     "Quote",
+    "TokenArray",
     "USD",
 ]
@@ -0,0 +1,28 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+# Clés des valeurs calculées paresseusement (hash, str, sérialisation) conservées dans __dict__.
+_CACHED_KEYS = ("_hash", "_str", "_ser")
+
+
+class _CachedModel(BaseModel):
+    """
+    Base des modèles figés qui conservent des valeurs calculées dans __dict__.
+
+    Le hash, la chaîne et la sérialisation sont calculés au premier appel puis conservés ;
+    le modèle étant figé, ils ne sont retirés que des copies (model_copy) et du pickle.
+    """
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        """Copie le modèle sans reprendre les valeurs en cache de l'original."""
+        copied = super().model_copy(update=update, deep=deep)
+        for key in _CACHED_KEYS:
+            copied.__dict__.pop(key, None)
+        return copied
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        """Exclut les valeurs en cache du pickle (le hash des str varie d'un processus à l'autre)."""
+        state = super().__getstate__()
+        state["__dict__"] = {k: v for k, v in state["__dict__"].items() if k not in _CACHED_KEYS}
+        return state
@@ -0,0 +1,175 @@
+"""
+Batch kernels operating on plain sequences of Decimal amounts.
+
+These helpers let callers process many values at once without building
+one Price/Token/Asset object per element. They keep Decimal arithmetic
+so batch results match the scalar operators exactly.
+"""
+
+from decimal import ROUND_DOWN, Decimal
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+Number = Union[Decimal, float, int, str]
+
+_ZERO = Decimal(0)
+
+# Precomputed quantizers (1, 0.1, 0.01, ...) indexed by precision, shared by
+# the kernels and the Quote classes.
+_QUANTIZERS = tuple(Decimal(10) ** -p for p in range(19))
+
+# Quantizers of precisions outside the table, computed on first use
+_EXTRA_QUANTIZERS: Dict[int, Decimal] = {}
+
+
+def _quantizer_for(precision: int) -> Decimal:
+    """Quantizer of a precision (e.g. 0.01 for 2), computed at most once per precision."""
+    if 0 <= precision < len(_QUANTIZERS):
+        return _QUANTIZERS[precision]
+    quantizer = _EXTRA_QUANTIZERS.get(precision)
+    if quantizer is None:
+        quantizer = _EXTRA_QUANTIZERS[precision] = Decimal(10) ** -precision
+    return quantizer
+
+
+@lru_cache(maxsize=1024)
+def _float_to_decimal(value: float) -> Decimal:
+    """Decimal of a float's shortest repr, memoized (multipliers and ratios repeat)."""
+    return Decimal(repr(value))
+
+
+def to_decimal(value: Number) -> Decimal:
+    """
+    Convert a number to Decimal.
+
+    Decimal values pass through unchanged and ints are converted directly
+    (exact, no string round-trip). Floats and strings go through str() so a
+    float keeps its shortest repr (0.1 -> Decimal("0.1")); float conversions
+    are memoized since the same operands come back on every call, except for
+    zeros: 0.0 and -0.0 are equal cache keys but have different reprs.
+
+    Args:
+        value: Number to convert
+
+    Returns:
+        Decimal value
+    """
+    t = type(value)
+    if t is Decimal:
+        return value
+    if t is int:
+        return Decimal(value)
+    if t is float:
+        return _float_to_decimal(value) if value else Decimal(repr(value))
+    return Decimal(str(value))
+
+
+def to_decimals(values: Iterable[Number]) -> List[Decimal]:
+    """
+    Convert numbers to Decimal, passing Decimal values through unchanged.
+
+    Args:
+        values: Numbers to convert
+
+    Returns:
+        List of Decimal values
+    """
+    return [to_decimal(v) for v in values]
+
+
+def add_amounts(a: Sequence[Decimal], b: Sequence[Decimal]) -> List[Decimal]:
+    """
+    Add two sequences of amounts element-wise.
+
+    Args:
+        a: First sequence of amounts
+        b: Second sequence of amounts
+
+    Returns:
+        List of sums
+
+    Raises:
+        ValueError: If the sequences have different lengths
+    """
+    if len(a) != len(b):
+        raise ValueError("Sequences must have the same length")
+    return [x + y for x, y in zip(a, b)]
+
+
+def mul_amounts(a: Sequence[Decimal], b: Sequence[Decimal]) -> List[Decimal]:
+    """
+    Multiply two sequences of amounts element-wise (e.g. prices by token amounts).
+
+    Args:
+        a: First sequence of amounts
+        b: Second sequence of amounts
+
+    Returns:
+        List of products (not truncated)
+
+    Raises:
+        ValueError: If the sequences have different lengths
+    """
+    if len(a) != len(b):
+        raise ValueError("Sequences must have the same length")
+    return [x * y for x, y in zip(a, b)]
+
+
+def split_amounts(
+    amounts: Sequence[Decimal], ratios: Sequence[Number], precision: int
+) -> Tuple[List[Decimal], List[Decimal]]:
+    """
+    Split amounts element-wise into a truncated share and the remainder.
+
+    The first part is amount * ratio truncated to the precision; the second
+    part is what is left, so both parts always add up to the amount.
+
+    Args:
+        amounts: Amounts to split (already at the given precision)
+        ratios: Share of each amount going to the first part
+        precision: Number of decimal places of the parts
+
+    Returns:
+        Tuple (first_parts, second_parts)
+
+    Raises:
+        ValueError: If the sequences have different lengths
+    """
+    if len(amounts) != len(ratios):
+        raise ValueError("Sequences must have the same length")
+    quantizer = _quantizer_for(precision)
+    firsts = [(a * to_decimal(r)).quantize(quantizer, rounding=ROUND_DOWN) for a, r in zip(amounts, ratios)]
+    seconds = [a - f for a, f in zip(amounts, firsts)]
+    return firsts, seconds
+
+
+def sum_amounts(values: Iterable[Decimal]) -> Decimal:
+    """
+    Sum amounts starting from a Decimal zero.
+
+    The result is always a Decimal, including for an empty sequence.
+
+    Args:
+        values: Amounts to sum
+
+    Returns:
+        Total as Decimal
+    """
+    return sum(values, _ZERO)
+
+
+def truncate_amounts(values: Iterable[Number], precision: int) -> List[Decimal]:
+    """
+    Truncate amounts to a precision (ROUND_DOWN), like Quote does per instance.
+
+    The quantizer comes from the precomputed table, not rebuilt per call.
+
+    Args:
+        values: Amounts to truncate
+        precision: Number of decimal places to keep
+
+    Returns:
+        List of truncated Decimal values
+    """
+    quantizer = _quantizer_for(precision)
+    return [v.quantize(quantizer, rounding=ROUND_DOWN) for v in to_decimals(values)]
@@ -1,11 +1,36 @@
-import json
-from decimal import Decimal
-from typing import Any, Dict, Union
+import sys
+from decimal import ROUND_DOWN, Decimal
+from json.encoder import encode_basestring_ascii as _encode_json_string
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from pydantic import Field, field_validator, model_serializer
 
+from python_trading_objects.quotes._kernels import to_decimal, truncate_amounts
 from python_trading_objects.quotes.assertion import bot_assert
-from python_trading_objects.quotes.quote import Quote
+from python_trading_objects.quotes.quote import _QUANTIZERS, Quote
+
+if TYPE_CHECKING:
+    from python_trading_objects.quotes.price import Price
+
+# Price is bound here by the price module once it is loaded (circular
+# import), so __truediv__ reads it as a module global.
+
+_STABLECOINS = frozenset(("USD", "USDC", "USDT", "DAI", "BUSD", "TUSD", "USDP"))
+_FIATS = frozenset(("USD", "EUR", "GBP", "JPY", "CHF", "CAD", "AUD"))
+
+# (is_stablecoin, is_fiat, precision) of every stablecoin/fiat symbol;
+# any other symbol is a crypto asset with 8 decimals.
+_CLASSIFICATION: Dict[str, Tuple[bool, bool, int]] = {
+    symbol: (symbol in _STABLECOINS, symbol in _FIATS, 2) for symbol in _STABLECOINS | _FIATS
+}
+_CRYPTO_CLASSIFICATION = (False, False, 8)
+
+_ZERO = Decimal(0)
+
+
+def _classify(symbol: str) -> Tuple[bool, bool, int]:
+    """Returns (is_stablecoin, is_fiat, precision) for an asset symbol."""
+    return _CLASSIFICATION.get(symbol, _CRYPTO_CLASSIFICATION)
 
 
 class Asset(Quote):
@@ -36,17 +61,7 @@ class Asset(Quote):
         bot_assert(amount, (Decimal, float, int, str))
 
         # Determine precision based on asset type
-        is_stablecoin = symbol in [
-            "USD",
-            "USDC",
-            "USDT",
-            "DAI",
-            "BUSD",
-            "TUSD",
-            "USDP",
-        ]
-        is_fiat = symbol in ["USD", "EUR", "GBP", "JPY", "CHF", "CAD", "AUD"]
-        precision_value = 2 if (is_fiat or is_stablecoin) else 8
+        is_stablecoin, is_fiat, precision_value = _classify(symbol)
 
         # Tronque le montant avec la précision correcte
         truncated_amount = Quote._truncate_to_precision_static(amount, precision_value)
@@ -60,16 +75,72 @@ class Asset(Quote):
         )
 
         # Store private attributes AFTER calling super().__init__
-        object.__setattr__(self, "_Asset__is_stablecoin", is_stablecoin)
-        object.__setattr__(self, "_Asset__is_fiat", is_fiat)
+        object.__setattr__(self, "_is_stablecoin", is_stablecoin)
+        object.__setattr__(self, "_is_fiat", is_fiat)
+
+    @classmethod
+    def _fast_new(
+            cls, amount: Decimal, symbol: str, raw_symbol: Optional[str] = None, amount_precision: Optional[int] = None
+    ) -> "Asset":
+        """
+        Creates an instance without re-running validation (internal use).
+
+        The amount must already be a Decimal and the symbol already
+        normalized; the amount is truncated to the symbol's precision like
+        the constructor does. Like the constructor, classification uses the
+        symbol as given by the caller (raw_symbol) when it is provided.
+        amount_precision tells that the amount already has that precision
+        (sum, difference or negation of same-precision operands), in which
+        case truncation is skipped when it matches the symbol's precision.
+        """
+        is_stablecoin, is_fiat, precision = _classify(symbol if raw_symbol is None else raw_symbol)
+        if amount_precision != precision:
+            amount = amount.quantize(_QUANTIZERS[precision], rounding=ROUND_DOWN)
+        asset = cls.model_construct(amount=amount, precision=precision, symbol=symbol)
+        object.__setattr__(asset, "_is_stablecoin", is_stablecoin)
+        object.__setattr__(asset, "_is_fiat", is_fiat)
+        return asset
+
+    @classmethod
+    def zero(cls, symbol: str) -> "Asset":
+        """
+        Creates a zero amount of the given asset.
+
+        Only the symbol is validated. A new instance is returned on every call.
+        """
+        return cls._fast_new(_ZERO, cls.validate_symbol(symbol), raw_symbol=symbol)
+
+    @classmethod
+    def from_array(cls, amounts: Iterable[Union[Decimal, float, int, str]], symbol: str) -> List["Asset"]:
+        """
+        Creates one instance per amount, truncating the whole series in one pass.
+
+        The symbol is classified once for the batch instead of once per amount.
+
+        Args:
+            amounts: Amounts to wrap
+            symbol: Asset symbol shared by every amount
+
+        Returns:
+            List of instances of the calling class (Asset or USD)
+        """
+        is_stablecoin, is_fiat, precision = _classify(symbol)
+        validated_symbol = cls.validate_symbol(symbol)
+        result = []
+        for amount in truncate_amounts(amounts, precision):
+            asset = cls.model_construct(amount=amount, precision=precision, symbol=validated_symbol)
+            object.__setattr__(asset, "_is_stablecoin", is_stablecoin)
+            object.__setattr__(asset, "_is_fiat", is_fiat)
+            result.append(asset)
+        return result
 
     @field_validator("symbol")
     @classmethod
     def validate_symbol(cls, v):
-        """Valide que le symbole est une chaîne non vide."""
+        """Valide que le symbole est une chaîne non vide (normalisée et internée)."""
         if not isinstance(v, str) or not v:
             raise ValueError("Symbol must be a non-empty string")
-        return v.upper()
+        return sys.intern(v.upper())
 
     def get_symbol(self) -> str:
         """Returns the asset symbol."""
@@ -81,25 +152,32 @@ class Asset(Quote):
 
     def is_stablecoin(self) -> bool:
         """Checks if the asset is a stablecoin."""
-        return self.__is_stablecoin
+        return self._is_stablecoin
 
     def is_fiat(self) -> bool:
         """Checks if the asset is a fiat currency."""
-        return self.__is_fiat
+        return self._is_fiat
 
     @model_serializer
     def serialize_model(self) -> Dict[str, Any]:
-        """Sérialise le modèle avec les float en string pour préserver la précision."""
-        return {
-            "amount": str(self.amount),
-            "precision": self.precision,
-            "symbol": self.symbol,
-        }
+        """Sérialise le modèle avec les float en string pour préserver la précision (voir Quote)."""
+        cached = self.__dict__.get("_ser")
+        if cached is None:
+            cached = self.__dict__["_ser"] = {
+                "amount": str(self.amount),
+                "precision": self.precision,
+                "symbol": self.symbol,
+            }
+        return dict(cached)
 
     def __str__(self):
-        """Returns a formatted string representation of the amount."""
-        decimals = 2 if self.__is_fiat or self.__is_stablecoin else 8
-        return f"{self.amount:.{decimals}f} {self.symbol}"
+        """Returns a formatted string representation of the amount (formatted once)."""
+        cached = self.__dict__.get("_str")
+        if cached is None:
+            decimals = 2 if self._is_fiat or self._is_stablecoin else 8
+            cached = f"{self.amount:.{decimals}f} {self.symbol}"
+            self.__dict__["_str"] = cached
+        return cached
 
     def __lt__(self, other):
         """
@@ -112,17 +190,17 @@ class Asset(Quote):
         bool: True if instance is less, False otherwise.
 
         Raises:
-        TypeError: If 'other' is not an Asset or number.
+        TypeError: If 'other' is an Asset with a different symbol. Other
+        operand types return NotImplemented so Python can try the reflected
+        comparison before raising.
         """
         if isinstance(other, Asset):
-            if other.get_symbol() != self.symbol:
+            if other.symbol != self.symbol:
                 raise TypeError(f"Cannot compare {self.symbol} with {other.symbol}")
             return self.amount < other.amount
-        elif isinstance(other, float):
+        if isinstance(other, float):
             return self.amount < other
-        raise TypeError(
-            f"Operand must be an instance of {self.symbol} or a number (float)"
-        )
+        return NotImplemented
 
     def __add__(self, other):
         """
@@ -135,16 +213,16 @@ class Asset(Quote):
         Asset: A new instance representing the sum.
 
         Raises:
-        TypeError: If 'other' is not an Asset instance or has different symbol.
+        TypeError: If 'other' has a different symbol. Non-Asset operands
+        return NotImplemented so Python can try the reflected operation.
         """
-        if isinstance(other, Asset):
-            if other.get_symbol() != self.symbol:
-                raise TypeError(f"Cannot add {self.symbol} with {other.get_symbol()}")
-            # Return USD instance if self is USD
-            if isinstance(self, USD):
-                return USD(self.amount + other.amount, self.symbol, _from_factory=True)
-            return Asset(self.amount + other.amount, self.symbol, _from_factory=True)
-        raise TypeError(f"Operand must be an instance of {self.symbol}")
+        if not isinstance(other, Asset):
+            return NotImplemented
+        if other.symbol != self.symbol:
+            raise TypeError(f"Cannot add {self.symbol} with {other.symbol}")
+        # Keeps the class of self (USD stays USD)
+        precision = self.precision if other.precision == self.precision else None
+        return type(self)._fast_new(self.amount + other.amount, self.symbol, amount_precision=precision)
 
     def __radd__(self, other):
         """
@@ -157,11 +235,7 @@ class Asset(Quote):
         Asset: A new instance representing the sum.
         """
         if isinstance(other, (Decimal, int, float)):
-            other_decimal = other if isinstance(other, Decimal) else Decimal(str(other))
-            # Return USD instance if self is USD
-            if isinstance(self, USD):
-                return USD(self.amount + other_decimal, self.symbol, _from_factory=True)
-            return Asset(self.amount + other_decimal, self.symbol, _from_factory=True)
+            return type(self)._fast_new(self.amount + to_decimal(other), self.symbol)
         return NotImplemented
 
     def __sub__(self, other):
@@ -175,18 +249,15 @@ class Asset(Quote):
         Asset: A new instance representing the difference.
 
         Raises:
-        TypeError: If 'other' is not an Asset instance or has different symbol.
+        TypeError: If 'other' has a different symbol. Non-Asset operands
+        return NotImplemented so Python can try the reflected operation.
         """
-        if isinstance(other, Asset):
-            if other.get_symbol() != self.symbol:
-                raise TypeError(
-                    f"Cannot subtract {other.get_symbol()} from {self.symbol}"
-                )
-            # Return USD instance if self is USD
-            if isinstance(self, USD):
-                return USD(self.amount - other.amount, self.symbol, _from_factory=True)
-            return Asset(self.amount - other.amount, self.symbol, _from_factory=True)
-        raise TypeError(f"Operand must be an instance of {self.symbol}")
+        if not isinstance(other, Asset):
+            return NotImplemented
+        if other.symbol != self.symbol:
+            raise TypeError(f"Cannot subtract {other.symbol} from {self.symbol}")
+        precision = self.precision if other.precision == self.precision else None
+        return type(self)._fast_new(self.amount - other.amount, self.symbol, amount_precision=precision)
 
     def __neg__(self):
         """
@@ -195,10 +266,7 @@ class Asset(Quote):
         Returns:
         Asset: A new instance representing the negative amount.
         """
-        # Return USD instance if self is USD
-        if isinstance(self, USD):
-            return USD(-self.amount, self.symbol, _from_factory=True)
-        return Asset(-self.amount, self.symbol, _from_factory=True)
+        return type(self)._fast_new(-self.amount, self.symbol, amount_precision=self.precision)
 
     def __mul__(self, other):
         """
@@ -211,14 +279,12 @@ class Asset(Quote):
         Asset: A new instance representing the result.
 
         Raises:
-        TypeError: If 'other' is not a number.
+        TypeError: If 'other' is not a number (raised by Python once the
+        reflected operation has also been tried).
         """
-        bot_assert(other, (Decimal, float, int))
-        other_decimal = other if isinstance(other, Decimal) else Decimal(str(other))
-        # Return USD instance if self is USD
-        if isinstance(self, USD):
-            return USD(self.amount * other_decimal, self.symbol, _from_factory=True)
-        return Asset(self.amount * other_decimal, self.symbol, _from_factory=True)
+        if not isinstance(other, (Decimal, float, int)):
+            return NotImplemented
+        return type(self)._fast_new(self.amount * to_decimal(other), self.symbol)
 
     def __truediv__(self, other):
         """
@@ -234,45 +300,32 @@ class Asset(Quote):
         TypeError: If 'other' is not a valid type.
         ZeroDivisionError: If division by zero is attempted.
         """
-        from python_trading_objects.quotes.coin import Token
-        from python_trading_objects.quotes.price import Price
-
-        if isinstance(other, (Decimal, int, float)):
-            other_decimal = other if isinstance(other, Decimal) else Decimal(str(other))
-            if other_decimal == 0:
-                raise ZeroDivisionError("Division by zero not allowed")
-            # Return USD instance if self is USD
-            if isinstance(self, USD):
-                return USD(self.amount / other_decimal, self.symbol, _from_factory=True)
-            return Asset(self.amount / other_decimal, self.symbol, _from_factory=True)
-
-        if isinstance(other, Asset):
-            if other.amount == 0:
-                raise ZeroDivisionError("Division by zero not allowed")
-            if other.get_symbol() != self.symbol:
-                # Division between different assets gives an exchange rate
-                return self.amount / other.amount
-            return self.amount / other.amount
-
-        if isinstance(other, Price):
-            # Convert price to Decimal if it's a float
-            price_decimal = other.price if isinstance(other.price, Decimal) else Decimal(str(other.price))
-            if price_decimal == 0:
-                raise ZeroDivisionError("Division by zero not allowed")
-            # Division Asset / Price gives tokens
-            return Token(
-                self.amount / price_decimal, other.get_base(), _from_factory=True
-            )
-
-        raise TypeError(f"Operand must be a number, {self.symbol} or Price")
+        handler = _DIV_DISPATCH.get(type(other))
+        if handler is None:
+            # Subclasses: fall back to isinstance
+            if isinstance(other, (Decimal, int, float)):
+                handler = _div_number
+            elif isinstance(other, Asset):
+                handler = _div_asset
+            elif isinstance(other, Price):
+                handler = _DIV_DISPATCH[Price]
+            else:
+                raise TypeError(f"Operand must be a number, {self.symbol} or Price")
+        return handler(self, other)
 
     def to_dict(self):
         """Converts the object to a dictionary with float as string for precision."""
         return {"price": str(self.amount), "symbol": self.symbol}
 
     def to_json(self):
-        """Converts the object to JSON."""
-        return json.dumps(self.to_dict())
+        """
+        Converts the object to JSON.
+
+        Formatted directly instead of building the to_dict() intermediate;
+        the symbol is escaped with the json module's own encoder, so the output
+        is identical to json.dumps(self.to_dict()).
+        """
+        return f'{{"price": "{self.amount}", "symbol": {_encode_json_string(self.symbol)}}}'
 
 
 # For backward compatibility, create USD alias
@@ -296,12 +349,38 @@ class USD(Asset):
 
     def get_quote(self) -> str:
         """Legacy method for compatibility."""
-        return self.get_symbol()
+        return self.symbol
 
     def to_dict(self):
         """Converts the object to a dictionary (legacy format) with float as string for precision."""
         return {"price": str(self.amount)}
 
     def to_json(self):
-        """Converts the object to JSON (legacy format)."""
-        return json.dumps(self.to_dict())
+        """Converts the object to JSON (legacy format), without going through json.dumps."""
+        return f'{{"price": "{self.amount}"}}'
+
+
+def _div_number(asset: Asset, other: Union[Decimal, int, float]) -> Asset:
+    """Asset / number: same class as the asset (USD stays USD)."""
+    other_decimal = to_decimal(other)
+    if other_decimal == 0:
+        raise ZeroDivisionError("Division by zero not allowed")
+    return type(asset)._fast_new(asset.amount / other_decimal, asset.symbol)
+
+
+def _div_asset(asset: Asset, other: Asset) -> Decimal:
+    """Asset / Asset: the ratio (an exchange rate when the symbols differ)."""
+    if other.amount == 0:
+        raise ZeroDivisionError("Division by zero not allowed")
+    return asset.amount / other.amount
+
+
+# Dispatch of Asset.__truediv__ on the exact operand type.
+# The Price entry is registered by the price module, which imports this one.
+_DIV_DISPATCH = {
+    Decimal: _div_number,
+    int: _div_number,
+    float: _div_number,
+    Asset: _div_asset,
+    USD: _div_asset,
+}
@@ -0,0 +1,132 @@
+"""
+Columnar container for a series of amounts of a single asset.
+
+An AssetArray stores the Decimal amounts in one list and the symbol once,
+instead of one Asset object per amount. Reductions (sum, mean) run over
+the raw values and only build an Asset for the result.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Iterable, Iterator, List
+
+from python_trading_objects.quotes._kernels import Number, add_amounts, sum_amounts, truncate_amounts
+from python_trading_objects.quotes.asset import Asset, _classify
+
+
+class AssetArray:
+    """
+    Series of amounts sharing the same asset symbol.
+
+    Amounts are truncated to the asset precision on construction, exactly
+    like individual Asset instances.
+    """
+
+    __slots__ = ("values", "symbol", "precision")
+
+    def __init__(self, values: Iterable[Number], symbol: str):
+        """
+        Initializes an AssetArray.
+
+        Parameters:
+        values (Iterable[Decimal|float|int|str]): The amounts.
+        symbol (str): The asset symbol (USD, USDC, BTC, etc.).
+        """
+        self.precision = _classify(symbol)[2]
+        self.symbol = Asset.validate_symbol(symbol)
+        self.values: List[Decimal] = truncate_amounts(values, self.precision)
+
+    @classmethod
+    def from_assets(cls, assets: Iterable[Asset]) -> AssetArray:
+        """
+        Builds an AssetArray from existing Asset instances in one pass.
+
+        Asset amounts are already truncated to their precision, so they are
+        copied as is when that precision matches the array's; truncation
+        only runs for assets built with a different precision.
+
+        Args:
+            assets: Assets with the same symbol (at least one)
+
+        Returns:
+            AssetArray holding the amounts
+
+        Raises:
+            ValueError: If no asset is given or the symbols differ
+        """
+        assets = list(assets)
+        if not assets:
+            raise ValueError("Cannot build an AssetArray from an empty series")
+        symbol = assets[0].symbol
+        if any(a.symbol != symbol for a in assets):
+            raise ValueError("All assets must share the same symbol")
+        result = cls((), symbol)
+        amounts = [a.amount for a in assets]
+        if all(a.precision == result.precision for a in assets):
+            result.values = amounts
+        else:
+            result.values = truncate_amounts(amounts, result.precision)
+        return result
+
+    def __len__(self) -> int:
+        """Returns the number of amounts in the series."""
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Asset:
+        """Returns the amount at the given index as an Asset."""
+        return Asset._fast_new(self.values[index], self.symbol)
+
+    def __add__(self, other: AssetArray) -> AssetArray:
+        """
+        Adds two series element-wise.
+
+        Raises:
+        ValueError: If the symbols or the lengths differ.
+        """
+        if not isinstance(other, AssetArray):
+            return NotImplemented
+        if other.symbol != self.symbol:
+            raise ValueError(f"Cannot add {self.symbol} with {other.symbol}")
+        return AssetArray(add_amounts(self.values, other.values), self.symbol)
+
+    def sum(self) -> Asset:
+        """Returns the total of the series as an Asset (zero if empty)."""
+        return Asset._fast_new(sum_amounts(self.values), self.symbol)
+
+    def mean(self) -> Asset:
+        """
+        Returns the average amount of the series as an Asset.
+
+        Raises:
+        ValueError: If the series is empty.
+        """
+        if not self.values:
+            raise ValueError("Cannot compute the mean of an empty series")
+        return Asset._fast_new(sum_amounts(self.values) / len(self.values), self.symbol)
+
+    def truncate(self, precision: int) -> AssetArray:
+        """
+        Returns a copy of the series truncated (ROUND_DOWN) to a coarser precision.
+
+        Args:
+            precision: Number of decimal places to keep
+
+        Returns:
+            New AssetArray with truncated amounts and the given precision
+
+        Raises:
+            ValueError: If precision is finer than the current one
+        """
+        if precision > self.precision:
+            raise ValueError(f"Cannot truncate {self.symbol} amounts from {self.precision} to {precision} decimals")
+        result = AssetArray((), self.symbol)
+        result.precision = precision
+        result.values = truncate_amounts(self.values, precision)
+        return result
+
+    def to_assets(self) -> Iterator[Asset]:
+        """Lazily yields one Asset per amount, for callers that need scalar objects."""
+        symbol = self.symbol
+        for value in self.values:
+            yield Asset._fast_new(value, symbol)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
-from decimal import Decimal
-from typing import Any, Dict, Union, TYPE_CHECKING
+import sys
+from decimal import ROUND_DOWN, Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
-from pydantic import Field, model_serializer
+from pydantic import Field, field_validator, model_serializer
 
+from python_trading_objects.quotes._kernels import split_amounts, to_decimal
 from python_trading_objects.quotes.assertion import bot_assert
 from python_trading_objects.quotes.quote import Quote
 
@@ -13,6 +14,11 @@ if TYPE_CHECKING:
     from python_trading_objects.quotes.price import Price
     from python_trading_objects.quotes.asset import Asset
 
+# Price est lié ici par le module price une fois chargé (import circulaire) :
+# les méthodes le lisent comme une globale au lieu de refaire l'import à chaque appel.
+
+_ZERO = Decimal(0)
+
 
 class Token(Quote):
     """
@@ -24,7 +30,7 @@ class Token(Quote):
 
     base_symbol: str = Field(..., description="Le symbole de la devise de base")
 
-    def __init__(self, amount: Union[Decimal, float, int, str], base_symbol: str, _from_factory: bool = False):
+    def __init__(self, amount: Union[Decimal, float, int, str], base_symbol: str, _from_factory: bool = False) -> None:
         """
         Initialise une instance de Token.
 
@@ -44,28 +50,67 @@ class Token(Quote):
         # Appelle le constructeur parent avec base_symbol
         super().__init__(amount, _from_factory=_from_factory, base_symbol=base_symbol)
 
+    @classmethod
+    def _fast_new(cls, amount: Decimal, base_symbol: str, amount_precision: Optional[int] = None) -> Token:
+        """
+        Crée une instance de Token sans repasser par la validation (usage interne).
+
+        Réservé aux résultats d'opérations sur des instances déjà validées :
+        le montant est déjà un Decimal, il est seulement tronqué à la précision
+        de la classe comme le ferait le constructeur. amount_precision indique
+        que le montant a déjà cette précision (somme, différence ou opposé
+        d'opérandes de même précision) : la troncature est alors sautée si
+        c'est celle de la classe.
+        """
+        precision = cls._class_precision
+        if amount_precision != precision:
+            amount = amount.quantize(cls._class_quantizer, rounding=ROUND_DOWN)
+        return cls.model_construct(amount=amount, precision=precision, base_symbol=base_symbol)
+
+    @classmethod
+    def zero(cls, base_symbol: str) -> Token:
+        """
+        Crée un Token de montant nul sans repasser par la validation.
+
+        Une nouvelle instance est retournée à chaque appel (voir Price.zero).
+        """
+        return cls._fast_new(_ZERO, base_symbol)
+
+    @field_validator("base_symbol")
+    @classmethod
+    def intern_base_symbol(cls, v: str) -> str:
+        """Interne le symbole déjà validé, comme les symboles de Price et Asset."""
+        return sys.intern(v)
+
     def get_base(self) -> str:
         """Retourne le symbole de la devise de base du token."""
         return self.base_symbol
 
-    def get_child_class(self):
+    def get_child_class(self) -> type:
         """Retourne le type de la classe fille de l'instance courante."""
         return self.__class__
 
     @model_serializer
     def serialize_model(self) -> Dict[str, Any]:
-        """Sérialise le modèle avec les float en string pour préserver la précision."""
-        return {
-            "amount": str(self.amount),
-            "precision": self.precision,
-            "base_symbol": self.base_symbol,
-        }
-
-    def __str__(self):
-        """Retourne une représentation formatée du montant du token."""
-        return f"{self.amount:.8f} {self.base_symbol}"  # Formatage à 8 décimales
-
-    def __lt__(self, other):
+        """Sérialise le modèle avec les float en string pour préserver la précision (voir Quote)."""
+        cached = self.__dict__.get("_ser")
+        if cached is None:
+            cached = self.__dict__["_ser"] = {
+                "amount": str(self.amount),
+                "precision": self.precision,
+                "base_symbol": self.base_symbol,
+            }
+        return dict(cached)
+
+    def __str__(self) -> str:
+        """Retourne une représentation formatée du montant du token (calculée une seule fois)."""
+        cached = self.__dict__.get("_str")
+        if cached is None:
+            cached = f"{self.amount:.8f} {self.base_symbol}"  # Formatage à 8 décimales
+            self.__dict__["_str"] = cached
+        return cached
+
+    def __lt__(self, other: Token | Decimal | float | int) -> bool:
         """
         Compare si l'instance actuelle est inférieure à une autre instance de Token ou un nombre.
 
@@ -78,15 +123,37 @@ class Token(Quote):
         Exception:
         TypeError: Si 'other' n'est pas un Token ou un nombre.
         """
-        if isinstance(other, Token):
+        if type(other) is Token or isinstance(other, Token):
             return self.amount < other.amount
-        elif isinstance(other, (Decimal, float, int)):
-            return self.amount < Decimal(str(other))
-        raise TypeError(
-            f"L'opérande doit être une instance de {self.base_symbol} ou un nombre"
-        )
+        if type(other) is float or isinstance(other, (Decimal, float, int)):
+            return self.amount < to_decimal(other)
+        return NotImplemented
+
+    def __le__(self, other: Token | Decimal | float | int) -> bool:
+        """Compare si l'instance actuelle est inférieure ou égale à un Token ou un nombre."""
+        if type(other) is Token or isinstance(other, Token):
+            return self.amount <= other.amount
+        if type(other) is float or isinstance(other, (Decimal, float, int)):
+            return self.amount <= to_decimal(other)
+        return NotImplemented
+
+    def __gt__(self, other: Token | Decimal | float | int) -> bool:
+        """Compare si l'instance actuelle est supérieure à un Token ou un nombre."""
+        if type(other) is Token or isinstance(other, Token):
+            return self.amount > other.amount
+        if type(other) is float or isinstance(other, (Decimal, float, int)):
+            return self.amount > to_decimal(other)
+        return NotImplemented
 
-    def __add__(self, other):
+    def __ge__(self, other: Token | Decimal | float | int) -> bool:
+        """Compare si l'instance actuelle est supérieure ou égale à un Token ou un nombre."""
+        if type(other) is Token or isinstance(other, Token):
+            return self.amount >= other.amount
+        if type(other) is float or isinstance(other, (Decimal, float, int)):
+            return self.amount >= to_decimal(other)
+        return NotImplemented
+
+    def __add__(self, other: Token) -> Token:
         """
         Additionne deux instances de Token.
 
@@ -99,10 +166,12 @@ class Token(Quote):
         Exception:
         TypeError: Si 'other' n'est pas une instance de Token.
         """
-        bot_assert(other, Token)
-        return Token(self.amount + other.amount, self.base_symbol, _from_factory=True)
+        if type(other) is not Token and not isinstance(other, Token):
+            return NotImplemented
+        precision = self.precision if other.precision == self.precision else None
+        return Token._fast_new(self.amount + other.amount, self.base_symbol, precision)
 
-    def __radd__(self, other):
+    def __radd__(self, other: Decimal | float | int) -> Token:
         """
         Gère l'addition lorsque Token est à droite de l'opérateur (+).
 
@@ -113,11 +182,11 @@ class Token(Quote):
         Token: Une nouvelle instance représentant la somme.
         """
         if isinstance(other, (Decimal, int, float)):
-            other_decimal = other if isinstance(other, Decimal) else Decimal(str(other))
-            return Token(self.amount + other_decimal, self.base_symbol, _from_factory=True)
+            other_decimal = to_decimal(other)
+            return Token._fast_new(self.amount + other_decimal, self.base_symbol)
         return NotImplemented
 
-    def __sub__(self, other):
+    def __sub__(self, other: Token) -> Token:
         """
         Soustrait une instance de Token d'une autre.
 
@@ -130,17 +199,19 @@ class Token(Quote):
         Exception:
         TypeError: Si 'other' n'est pas une instance de Token.
         """
-        bot_assert(other, Token)
-        return Token(self.amount - other.amount, self.base_symbol, _from_factory=True)
+        if type(other) is not Token and not isinstance(other, Token):
+            return NotImplemented
+        precision = self.precision if other.precision == self.precision else None
+        return Token._fast_new(self.amount - other.amount, self.base_symbol, precision)
 
-    def __neg__(self):
+    def __neg__(self) -> Token:
         """
         Retourne le montant négatif de l'instance courante de Token.
 
         Retourne:
         Token: Une nouvelle instance représentant le montant négatif.
         """
-        return Token(-self.amount, self.base_symbol, _from_factory=True)
+        return Token._fast_new(-self.amount, self.base_symbol, self.precision)
 
     def __mul__(self, other: Decimal | float | int | Price) -> Token | Asset:
         """
@@ -156,29 +227,18 @@ class Token(Quote):
         Exception:
         TypeError: Si 'other' n'est ni un nombre ni une instance de Price.
         """
-        from python_trading_objects.quotes.asset import USD, Asset
-        from python_trading_objects.quotes.price import Price
-
-        bot_assert(other, (Decimal, float, int, Price))
-
-        if isinstance(other, (Decimal, float, int)):
-            if not isinstance(other, Decimal):
-                other = Decimal(str(other))
-            return Token(self.amount * other, self.base_symbol, _from_factory=True)
-        if isinstance(other, Price):
-            # Convert price to Decimal if it's a float
-            price_decimal = other.price if isinstance(other.price, Decimal) else Decimal(str(other.price))
-            # Return USD for backward compatibility when quote is USD
-            if other.get_quote() == "USD":
-                return USD(
-                    self.amount * price_decimal, other.get_quote(), _from_factory=True
-                )
-            return Asset(
-                self.amount * price_decimal, other.get_quote(), _from_factory=True
-            )
-        return NotImplemented
-
-    def __truediv__(self, other):
+        handler = _MUL_DISPATCH.get(type(other))
+        if handler is None:
+            # Sous-classes : repli sur isinstance
+            if isinstance(other, Price):
+                handler = _MUL_DISPATCH[Price]
+            elif isinstance(other, (Decimal, float, int)):
+                handler = _mul_number
+            else:
+                return NotImplemented
+        return handler(self, other)
+
+    def __truediv__(self, other: Decimal | float | int | Token) -> Token | Decimal:
         """
         Divise l'instance de Token par un nombre ou une autre instance de Token.
 
@@ -193,25 +253,21 @@ class Token(Quote):
         TypeError: Si 'other' n'est pas un nombre ou Token.
         ZeroDivisionError: Si une division par zéro est tentée.
         """
-        if isinstance(other, (Decimal, float, int)):
-            other_decimal = other if isinstance(other, Decimal) else Decimal(str(other))
-            if other_decimal == 0:
-                raise ZeroDivisionError("Division par zéro interdite")
-            return Token(self.amount / other_decimal, self.base_symbol, _from_factory=True)
-        if isinstance(other, Token):
-            if other.amount == 0:
-                raise ZeroDivisionError("Division par zéro interdite")
-            return self.amount / other.amount
-        raise TypeError(f"L'opérande doit être un nombre ou {self.base_symbol}")
-
-    def to_dict(self):
+        handler = _DIV_DISPATCH.get(type(other))
+        if handler is None:
+            # Sous-classes : repli sur isinstance
+            if isinstance(other, (Decimal, float, int)):
+                handler = _div_number
+            elif isinstance(other, Token):
+                handler = _div_token
+            else:
+                raise TypeError(f"L'opérande doit être un nombre ou {self.base_symbol}")
+        return handler(self, other)
+
+    def to_dict(self) -> Dict[str, str]:
         """Convertit l'objet en dictionnaire avec les float en string pour préserver la précision."""
         return {"price": str(self.amount)}
 
-    def to_json(self):
-        """Convertit l'objet en JSON."""
-        return json.dumps(self.to_dict())
-
     def value_at(self, price: Price) -> Asset:
         """
         Calculate value of tokens at given price.
@@ -222,8 +278,6 @@ class Token(Quote):
         Returns:
             Asset representing total value
         """
-        from python_trading_objects.quotes.price import Price
-
         if not isinstance(price, Price):
             raise TypeError("price must be an instance of Price")
 
@@ -234,6 +288,9 @@ class Token(Quote):
         """
         Split tokens into two parts by ratio.
 
+        The second part is the remainder of the first, so both parts always
+        add up to the original amount.
+
         Args:
             ratio: Ratio for first part (0.3 = 30%)
 
@@ -243,9 +300,55 @@ class Token(Quote):
         if not 0 <= ratio <= 1:
             raise ValueError("ratio must be between 0 and 1")
 
-        first_amount = self.amount * Decimal(str(ratio))
-        second_amount = self.amount * Decimal(str(1 - ratio))
-        return (
-            Token(first_amount, self.base_symbol, _from_factory=True),
-            Token(second_amount, self.base_symbol, _from_factory=True)
-        )
+        first = Token._fast_new(self.amount * to_decimal(ratio), self.base_symbol)
+        return first, Token._fast_new(self.amount - first.amount, self.base_symbol)
+
+    @classmethod
+    def split_many(cls, tokens: Sequence[Token], ratios: Sequence[float]) -> List[Tuple[Token, Token]]:
+        """
+        Split several tokens in one pass (same parts as token.split(ratio)).
+
+        Args:
+            tokens: Tokens to split
+            ratios: Ratio for the first part of each token (same length)
+
+        Returns:
+            List of (first_part, second_part) tuples
+        """
+        if any(not 0 <= ratio <= 1 for ratio in ratios):
+            raise ValueError("ratio must be between 0 and 1")
+
+        firsts, seconds = split_amounts([token.amount for token in tokens], ratios, cls._class_precision)
+        return [
+            (cls._fast_new(first, token.base_symbol), cls._fast_new(second, token.base_symbol))
+            for token, first, second in zip(tokens, firsts, seconds)
+        ]
+
+
+def _mul_number(token: Token, other: Decimal | float | int) -> Token:
+    """Token * nombre : retourne un nouveau Token."""
+    return Token._fast_new(token.amount * to_decimal(other), token.base_symbol)
+
+
+# Dispatch de Token.__mul__ selon le type exact de l'opérande.
+# L'entrée Price est enregistrée par le module price, qui importe celui-ci.
+_MUL_DISPATCH = {Decimal: _mul_number, float: _mul_number, int: _mul_number}
+
+
+def _div_number(token: Token, other: Decimal | float | int) -> Token:
+    """Token / nombre : retourne un nouveau Token."""
+    other_decimal = to_decimal(other)
+    if other_decimal == 0:
+        raise ZeroDivisionError("Division par zéro interdite")
+    return Token._fast_new(token.amount / other_decimal, token.base_symbol)
+
+
+def _div_token(token: Token, other: Token) -> Decimal:
+    """Token / Token : retourne le ratio des montants."""
+    if other.amount == 0:
+        raise ZeroDivisionError("Division par zéro interdite")
+    return token.amount / other.amount
+
+
+# Dispatch de Token.__truediv__ selon le type exact de l'opérande.
+_DIV_DISPATCH = {Decimal: _div_number, float: _div_number, int: _div_number, Token: _div_token}
@@ -1,5 +1,24 @@
+import sys
 from decimal import Decimal
-from typing import Union
+from functools import lru_cache
+from typing import Any, Iterable, Tuple, Union
+
+from python_trading_objects.quotes.asset import USD, Asset
+from python_trading_objects.quotes.asset_array import AssetArray
+from python_trading_objects.quotes.coin import Token
+from python_trading_objects.quotes.price import Price
+from python_trading_objects.quotes.price_array import PriceArray
+from python_trading_objects.quotes.token_array import TokenArray
+
+
+# Parsed "BASE/QUOTE" strings are cached (bounded like BotPair.get), so pairs
+# re-created per message skip the split
+@lru_cache(maxsize=256)
+def _parse_pair(pair: str) -> Tuple[str, str]:
+    """Splits a "BASE/QUOTE" pair into interned symbols, caching the result."""
+    base_symbol, quote_symbol = pair.split("/")
+    # Interned so every object created from this pair shares the same strings
+    return sys.intern(base_symbol), sys.intern(quote_symbol)
 
 
 class BotPair:
@@ -8,6 +27,8 @@ class BotPair:
     specific to a currency pair.
     """
 
+    __slots__ = ("pair", "base_symbol", "quote_symbol", "friendly_name")
+
     def __init__(self, pair: str):
         """
         Initializes a BotPair instance with a currency pair.
@@ -16,63 +37,100 @@ class BotPair:
         pair (str): The currency pair in "BASE/QUOTE" format (e.g., "BTC/USDC", "ETH/EUR").
         """
         self.pair = pair
-        self.base_symbol, self.quote_symbol = pair.split("/")
+        self.base_symbol, self.quote_symbol = _parse_pair(pair)
         self.friendly_name = self.base_symbol + self.quote_symbol
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get(pair: str) -> "BotPair":
+        """
+        Returns a shared BotPair instance for a currency pair.
+
+        For services that need a pair per request or per tick: the instance is
+        built once per pair string and reused. Since every caller shares it,
+        it is a read-only BotPair (AttributeError on assignment).
+
+        Parameters:
+        pair (str): The currency pair in "BASE/QUOTE" format (e.g., "BTC/USDC").
+        """
+        return _SharedBotPair._from_pair(BotPair(pair))
+
     # Generic methods for any asset type
     def create_base_asset(self, amount: Union[Decimal, float, str, int]):
         """Creates an Asset instance for the base currency."""
-        from python_trading_objects.quotes.asset import Asset
-
         return Asset(amount, self.base_symbol, _from_factory=True)
 
     def create_quote_asset(self, amount: Union[Decimal, float, str, int]):
         """Creates an Asset instance for the quote currency."""
-        from python_trading_objects.quotes.asset import Asset
-
         return Asset(amount, self.quote_symbol, _from_factory=True)
 
+    def create_quote_asset_array(self, amounts: Iterable[Union[Decimal, float, str, int]]):
+        """Creates an AssetArray holding a series of quote currency amounts."""
+        return AssetArray(amounts, self.quote_symbol)
+
     def zero_base(self):
         """Creates a base Asset instance with zero value."""
-        return self.create_base_asset(Decimal("0"))
+        return Asset.zero(self.base_symbol)
 
     def zero_quote(self):
         """Creates a quote Asset instance with zero value."""
-        return self.create_quote_asset(Decimal("0"))
+        return Asset.zero(self.quote_symbol)
 
     # Legacy methods for backward compatibility
     def create_token(self, amount: Union[Decimal, float, str, int]):
         """Legacy: Creates a Token instance for the base currency of this pair."""
-        from python_trading_objects.quotes.coin import Token
-
         return Token(amount, self.base_symbol, _from_factory=True)
 
     def create_price(self, value: Union[Decimal, float, str, int]):
         """Creates a Price instance for this pair."""
-        from python_trading_objects.quotes.price import Price
-
         return Price(value, self.base_symbol, self.quote_symbol, _from_factory=True)
 
+    def create_token_array(self, amounts: Iterable[Union[Decimal, float, str, int]]):
+        """Creates a TokenArray holding a series of base currency amounts."""
+        return TokenArray(amounts, self.base_symbol)
+
+    def create_price_array(self, values: Iterable[Union[Decimal, float, str, int]]):
+        """Creates a PriceArray holding a series of prices for this pair."""
+        return PriceArray(values, self.base_symbol, self.quote_symbol)
+
     def create_usd(self, amount: Union[Decimal, float, str, int]):
         """Legacy: Creates an instance for the quote currency (not necessarily USD!)."""
-        from python_trading_objects.quotes.asset import USD
-
         return USD(amount, self.quote_symbol, _from_factory=True)
 
     def zero_token(self):
         """Legacy: Creates a Token instance with zero value."""
-        from python_trading_objects.quotes.coin import Token
-
-        return Token(Decimal("0"), self.base_symbol, _from_factory=True)
+        return Token.zero(self.base_symbol)
 
     def zero_usd(self):
         """Legacy: Creates a quote asset with zero value."""
-        from python_trading_objects.quotes.asset import USD
-
-        return USD(Decimal("0"), self.quote_symbol, _from_factory=True)
+        return USD.zero(self.quote_symbol)
 
     def zero_price(self):
         """Creates a Price instance with zero value."""
-        from python_trading_objects.quotes.price import Price
+        return Price.zero(self.base_symbol, self.quote_symbol)
+
+
+class _SharedBotPair(BotPair):
+    """Read-only BotPair returned by BotPair.get, shared by all its callers."""
+
+    __slots__ = ()
+
+    @classmethod
+    def _from_pair(cls, source: BotPair) -> "_SharedBotPair":
+        """Copies the attributes of a regular BotPair into a read-only instance."""
+        shared = object.__new__(cls)
+        for name in BotPair.__slots__:
+            object.__setattr__(shared, name, getattr(source, name))
+        return shared
+
+    def __reduce__(self):
+        """Unpickles to the shared instance of the pair."""
+        return BotPair.get, (self.pair,)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Rejects assignments: the instance is shared."""
+        raise AttributeError(f"Shared BotPair {self.pair} is read-only")
 
-        return Price(Decimal("0"), self.base_symbol, self.quote_symbol, _from_factory=True)
+    def __delattr__(self, name: str) -> None:
+        """Rejects deletions: the instance is shared."""
+        raise AttributeError(f"Shared BotPair {self.pair} is read-only")
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-import json
+import sys
 from decimal import Decimal
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Sequence
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer
+from pydantic import ConfigDict, Field, field_validator, model_serializer
 
+from python_trading_objects.quotes import asset as _asset_module
+from python_trading_objects.quotes import coin as _coin_module
+from python_trading_objects.quotes._cached import _CachedModel
+from python_trading_objects.quotes._kernels import add_amounts, mul_amounts, to_decimal, to_decimals, truncate_amounts
 from python_trading_objects.quotes.assertion import bot_assert
+from python_trading_objects.quotes.asset import _DIV_DISPATCH as _ASSET_DIV_DISPATCH
+from python_trading_objects.quotes.asset import USD, Asset, _classify
+from python_trading_objects.quotes.coin import _MUL_DISPATCH as _TOKEN_MUL_DISPATCH
+from python_trading_objects.quotes.coin import Token
 
-if TYPE_CHECKING:
-    from python_trading_objects.quotes.asset import Asset
-    from python_trading_objects.quotes.coin import Token
+_ZERO = Decimal(0)
 
 
-class Price(BaseModel):
+class Price(_CachedModel):
     """
     Représente le prix d'une devise de base par rapport à une devise de cotation.
 
@@ -22,7 +28,7 @@ class Price(BaseModel):
 
     # Configuration Pydantic
     model_config = ConfigDict(
-        validate_assignment=True,
+        frozen=True,
         arbitrary_types_allowed=True,
         extra="forbid",
     )
@@ -37,7 +43,7 @@ class Price(BaseModel):
             base_symbol: str,
             quote_symbol: str,
             _from_factory: bool = False,
-    ):
+    ) -> None:
         """
         Initialise une instance de Price.
 
@@ -56,24 +62,55 @@ class Price(BaseModel):
         bot_assert(price, (Decimal, float, int))
 
         super().__init__(
-            price=Decimal(str(price)), base_symbol=base_symbol, quote_symbol=quote_symbol
+            price=price, base_symbol=base_symbol, quote_symbol=quote_symbol
+        )
+
+    @classmethod
+    def _fast_new(cls, price: Decimal, base_symbol: str, quote_symbol: str) -> Price:
+        """
+        Crée une instance de Price sans repasser par la validation (usage interne).
+
+        Réservé aux résultats d'opérations sur des instances déjà validées :
+        le prix est déjà un Decimal et les symboles sont déjà normalisés.
+        """
+        return cls.model_construct(
+            price=price, base_symbol=base_symbol, quote_symbol=quote_symbol
+        )
+
+    @classmethod
+    def zero(cls, base_symbol: str, quote_symbol: str) -> Price:
+        """
+        Crée un prix nul pour la paire donnée.
+
+        Seuls les symboles sont validés. Une nouvelle instance est retournée à
+        chaque appel.
+        """
+        return cls._fast_new(
+            _ZERO, cls.validate_symbols(base_symbol), cls.validate_symbols(quote_symbol)
         )
 
     @field_validator("price", mode="before")
     @classmethod
-    def validate_price(cls, v):
-        """Valide que le prix est un nombre."""
-        if not isinstance(v, (Decimal, float, int, str)):
+    def validate_price(cls, v: Any) -> Decimal:
+        """Valide que le prix est un nombre et le convertit en Decimal."""
+        if isinstance(v, Decimal):
+            return v
+        if not isinstance(v, (float, int, str)):
             raise TypeError(f"Price must be Decimal, float, int or str, got {type(v)}")
-        return Decimal(str(v))
+        return to_decimal(v)
 
     @field_validator("base_symbol", "quote_symbol")
     @classmethod
-    def validate_symbols(cls, v):
-        """Valide que les symboles sont des chaînes non vides."""
+    def validate_symbols(cls, v: Any) -> str:
+        """
+        Valide que les symboles sont des chaînes non vides.
+
+        Le symbole normalisé est interné : tous les Price d'une même paire
+        partagent les mêmes chaînes et les comparaisons se font par identité.
+        """
         if not isinstance(v, str) or not v:
             raise ValueError("Symbol must be a non-empty string")
-        return v.upper()
+        return sys.intern(v.upper())
 
     def get_base(self) -> str:
         """Retourne le symbole de la devise de base du prix."""
@@ -83,11 +120,15 @@ class Price(BaseModel):
         """Retourne le symbole de la devise de cotation du prix."""
         return self.quote_symbol
 
-    def __str__(self):
-        """Retourne une représentation formatée du prix."""
-        return f"{self.price:.2f} {self.base_symbol}/{self.quote_symbol}"
+    def __str__(self) -> str:
+        """Retourne une représentation formatée du prix (calculée une seule fois)."""
+        cached = self.__dict__.get("_str")
+        if cached is None:
+            cached = f"{self.price:.2f} {self.base_symbol}/{self.quote_symbol}"
+            self.__dict__["_str"] = cached
+        return cached
 
-    def __add__(self, other):
+    def __add__(self, other: Price) -> Price:
         """
         Additionne deux instances de Price.
 
@@ -100,15 +141,13 @@ class Price(BaseModel):
         Exception:
         TypeError: Si 'other' n'est pas une instance de Price.
         """
-        bot_assert(other, Price)
-        return Price(
-            self.price + other.price,
-            self.base_symbol,
-            self.quote_symbol,
-            _from_factory=True,
+        if type(other) is not Price and not isinstance(other, Price):
+            return NotImplemented
+        return Price._fast_new(
+            self.price + other.price, self.base_symbol, self.quote_symbol
         )
 
-    def __sub__(self, other):
+    def __sub__(self, other: Price) -> Price:
         """
         Soustrait une instance de Price d'une autre.
 
@@ -121,15 +160,13 @@ class Price(BaseModel):
         Exception:
         TypeError: Si 'other' n'est pas de type Price.
         """
-        bot_assert(other, Price)
-        return Price(
-            self.price - other.price,
-            self.base_symbol,
-            self.quote_symbol,
-            _from_factory=True,
+        if type(other) is not Price and not isinstance(other, Price):
+            return NotImplemented
+        return Price._fast_new(
+            self.price - other.price, self.base_symbol, self.quote_symbol
         )
 
-    def __truediv__(self, other):
+    def __truediv__(self, other: int | float | Price) -> Price | Decimal:
         """
         Divise un Price par un nombre ou un autre Price.
 
@@ -144,20 +181,16 @@ class Price(BaseModel):
         TypeError: Si 'other' n'est pas un float, int ou Price.
         ZeroDivisionError: Si la division par zéro est tentée.
         """
-        if isinstance(other, (int, float)):
-            if other == 0:
-                raise ZeroDivisionError("Division par zéro interdite")
-            return Price(
-                self.price / Decimal(str(other)),
-                self.base_symbol,
-                self.quote_symbol,
-                _from_factory=True,
-            )
-        if isinstance(other, Price):
-            if other.price == 0:
-                raise ZeroDivisionError("Division par zéro interdite")
-            return self.price / other.price
-        raise TypeError(f"L'opérande doit être un int, float ou Price")
+        handler = _DIV_DISPATCH.get(type(other))
+        if handler is None:
+            # Sous-classes : repli sur isinstance
+            if isinstance(other, Price):
+                handler = _div_price
+            elif isinstance(other, (int, float)):
+                handler = _div_number
+            else:
+                return NotImplemented
+        return handler(self, other)
 
     def __mul__(self, other: int | float | Token) -> Price | Asset:
         """
@@ -173,28 +206,18 @@ class Price(BaseModel):
         Exception:
         TypeError: Si 'other' n'est pas un float, int ou Token.
         """
-        from python_trading_objects.quotes.asset import USD, Asset
-        from python_trading_objects.quotes.coin import Token
-
-        bot_assert(other, (int, float, Token))
-
-        if isinstance(other, (int, float)):
-            return Price(
-                self.price * Decimal(str(other)),
-                self.base_symbol,
-                self.quote_symbol,
-                _from_factory=True,
-            )
-        if isinstance(other, Token):
-            # Price is now Decimal, can multiply directly with Token.amount
-            amount = self.price * other.amount
-            # Return USD for backward compatibility when quote is USD
-            if self.quote_symbol == "USD":
-                return USD(amount, self.quote_symbol, _from_factory=True)
-            return Asset(amount, self.quote_symbol, _from_factory=True)
-        return NotImplemented
-
-    def __eq__(self, other):
+        handler = _MUL_DISPATCH.get(type(other))
+        if handler is None:
+            # Sous-classes : repli sur isinstance
+            if isinstance(other, Token):
+                handler = _mul_token
+            elif isinstance(other, (int, float)):
+                handler = _mul_number
+            else:
+                return NotImplemented
+        return handler(self, other)
+
+    def __eq__(self, other: object) -> bool:
         """
         Vérifie si deux instances de Price sont égales.
 
@@ -204,14 +227,19 @@ class Price(BaseModel):
         Retourne:
         bool: True si les prix sont égaux, False sinon.
         """
-        bot_assert(other, Price)
+        if self is other:
+            return True
+        if type(other) is not Price and not isinstance(other, Price):
+            return NotImplemented
         return self.price == other.price
 
-    def __ne__(self, other):
+    def __ne__(self, other: object) -> bool:
         """Vérifie si deux instances de Price ne sont pas égales."""
-        return not self.__eq__(other)
+        if type(other) is not Price and not isinstance(other, Price):
+            return NotImplemented
+        return self.price != other.price
 
-    def __lt__(self, other):
+    def __lt__(self, other: Price) -> bool:
         """
         Vérifie si une instance de Price est inférieure à une autre.
 
@@ -221,14 +249,17 @@ class Price(BaseModel):
         Retourne:
         bool: True si le prix est inférieur, False sinon.
         """
-        bot_assert(other, Price)
+        if type(other) is not Price and not isinstance(other, Price):
+            return NotImplemented
         return self.price < other.price
 
-    def __le__(self, other):
+    def __le__(self, other: Price) -> bool:
         """Vérifie si une instance de Price est inférieure ou égale à une autre."""
-        return self.__lt__(other) or self.__eq__(other)
+        if type(other) is not Price and not isinstance(other, Price):
+            return NotImplemented
+        return self.price <= other.price
 
-    def __gt__(self, other):
+    def __gt__(self, other: Price) -> bool:
         """
         Vérifie si une instance de Price est supérieure à une autre.
 
@@ -238,33 +269,57 @@ class Price(BaseModel):
         Retourne:
         bool: True si le prix est supérieur, False sinon.
         """
-        bot_assert(other, Price)
+        if type(other) is not Price and not isinstance(other, Price):
+            return NotImplemented
         return self.price > other.price
 
-    def __ge__(self, other):
+    def __ge__(self, other: Price) -> bool:
         """Vérifie si une instance de Price est supérieure ou égale à une autre."""
-        return self.__gt__(other) or self.__eq__(other)
+        if type(other) is not Price and not isinstance(other, Price):
+            return NotImplemented
+        return self.price >= other.price
 
-    def __hash__(self):
-        """Rend la classe hashable pour utilisation dans des sets/dicts."""
-        return hash((self.price, self.base_symbol, self.quote_symbol))
+    def __hash__(self) -> int:
+        """
+        Rend la classe hashable pour utilisation dans des sets/dicts.
+
+        Le hash est mis en cache au premier appel (voir _CachedModel).
+        """
+        cached = self.__dict__.get("_hash")
+        if cached is None:
+            cached = hash((self.price, self.base_symbol, self.quote_symbol))
+            self.__dict__["_hash"] = cached
+        return cached
 
     @model_serializer
     def serialize_model(self) -> Dict[str, Any]:
-        """Sérialise le modèle avec les float en string pour préserver la précision."""
-        return {
-            "price": str(self.price),
-            "base_symbol": self.base_symbol,
-            "quote_symbol": self.quote_symbol,
-        }
-
-    def to_dict(self):
+        """
+        Sérialise le modèle avec les float en string pour préserver la précision.
+
+        Le dictionnaire est construit au premier appel puis conservé dans
+        __dict__ (retiré des copies comme le hash) ; une copie est retournée.
+        """
+        cached = self.__dict__.get("_ser")
+        if cached is None:
+            cached = self.__dict__["_ser"] = {
+                "price": str(self.price),
+                "base_symbol": self.base_symbol,
+                "quote_symbol": self.quote_symbol,
+            }
+        return dict(cached)
+
+    def to_dict(self) -> Dict[str, str]:
         """Convertit l'objet en dictionnaire avec les float en string pour préserver la précision."""
         return {"price": str(self.price)}
 
-    def to_json(self):
-        """Convertit l'objet en JSON."""
-        return json.dumps(self.to_dict())
+    def to_json(self) -> str:
+        """
+        Convertit l'objet en JSON.
+
+        Le document n'a qu'une clé et str(Decimal) ne contient aucun caractère
+        à échapper : on le formate directement, sans passer par json.dumps.
+        """
+        return f'{{"price": "{self.price}"}}'
 
     def is_positive(self) -> bool:
         """
@@ -293,6 +348,18 @@ class Price(BaseModel):
         """
         return self.price < 0
 
+    def sign(self) -> int:
+        """
+        Retourne le signe du prix (voir Quote.sign).
+
+        Retourne:
+        int: -1 si le prix est négatif, 0 s'il est nul, 1 s'il est positif.
+        """
+        price = self.price
+        if price.is_zero():
+            return 0
+        return -1 if price.is_signed() else 1
+
     def is_within_percentage(self, target: Price, tolerance_pct: float) -> bool:
         """
         Check if price is within tolerance % of target.
@@ -319,8 +386,8 @@ class Price(BaseModel):
         Returns:
             New Price with percentage applied
         """
-        new_price = self.price * (1 + Decimal(str(pct)))
-        return Price(new_price, self.base_symbol, self.quote_symbol, _from_factory=True)
+        new_price = self.price * (1 + to_decimal(pct))
+        return Price._fast_new(new_price, self.base_symbol, self.quote_symbol)
 
     def distance_from(self, other: Price) -> float:
         """
@@ -342,4 +409,123 @@ class Price(BaseModel):
         if buy_price.base_symbol != sell_price.base_symbol or buy_price.quote_symbol != sell_price.quote_symbol:
             raise ValueError("Cannot calculate midpoint for prices with different symbols")
         avg = (buy_price.price + sell_price.price) / 2
-        return Price(avg, buy_price.base_symbol, buy_price.quote_symbol, _from_factory=True)
+        return Price._fast_new(avg, buy_price.base_symbol, buy_price.quote_symbol)
+
+    @classmethod
+    def from_array(
+            cls, values: Iterable[Decimal | float | int | str], base_symbol: str, quote_symbol: str
+    ) -> List[Price]:
+        """
+        Create Prices for a whole series of values in one pass.
+
+        Args:
+            values: Price values
+            base_symbol: Base currency symbol (e.g. BTC)
+            quote_symbol: Quote currency symbol (e.g. USD)
+
+        Returns:
+            List of Price instances sharing the same symbols
+        """
+        base = cls.validate_symbols(base_symbol)
+        quote = cls.validate_symbols(quote_symbol)
+        return [cls._fast_new(value, base, quote) for value in to_decimals(values)]
+
+    @staticmethod
+    def to_array(prices: Iterable[Price]) -> List[Decimal]:
+        """Extract the raw Decimal values of a series of Prices"""
+        return [p.price for p in prices]
+
+    @staticmethod
+    def batch_add(a: Sequence[Decimal], b: Sequence[Decimal]) -> List[Decimal]:
+        """
+        Add two series of price values element-wise.
+
+        Works on raw values (see to_array) so no Price is built per element.
+
+        Args:
+            a: First series of values
+            b: Second series of values
+
+        Returns:
+            List of summed values
+        """
+        return add_amounts(a, b)
+
+    @staticmethod
+    def batch_mul(prices: Sequence[Decimal], amounts: Sequence[Decimal], quote_symbol: str) -> List[Decimal]:
+        """
+        Value a series of token amounts at a series of prices element-wise.
+
+        Same values as (price * token).amount for each pair, truncated to the
+        quote asset precision, without building a Price, Token or Asset per
+        element.
+
+        Args:
+            prices: Price values (see to_array)
+            amounts: Token amounts, same length as prices
+            quote_symbol: Quote currency symbol, which sets the precision
+
+        Returns:
+            List of values in the quote currency
+        """
+        return truncate_amounts(mul_amounts(prices, amounts), _classify(quote_symbol.upper())[2])
+
+
+def _mul_number(price: Price, other: int | float) -> Price:
+    """Price * nombre : retourne un nouveau Price."""
+    return Price._fast_new(
+        price.price * to_decimal(other), price.base_symbol, price.quote_symbol
+    )
+
+
+def _mul_token(price: Price, token: Token) -> Asset:
+    """Price * Token : retourne un montant dans la devise de cotation."""
+    amount = price.price * token.amount
+    # Return USD for backward compatibility when quote is USD
+    if price.quote_symbol == "USD":
+        return USD._fast_new(amount, price.quote_symbol)
+    return Asset._fast_new(amount, price.quote_symbol)
+
+
+def _token_mul_price(token: Token, price: Price) -> Asset:
+    """Token * Price : même résultat que Price * Token."""
+    return _mul_token(price, token)
+
+
+def _asset_div_price(asset: Asset, price: Price) -> Token:
+    """Asset / Price : retourne la quantité de tokens de la devise de base."""
+    if price.price == 0:
+        raise ZeroDivisionError("Division by zero not allowed")
+    return Token._fast_new(asset.amount / price.price, price.base_symbol)
+
+
+def _div_number(price: Price, other: int | float) -> Price:
+    """Price / nombre : retourne un nouveau Price."""
+    if other == 0:
+        raise ZeroDivisionError("Division par zéro interdite")
+    return Price._fast_new(
+        price.price / to_decimal(other), price.base_symbol, price.quote_symbol
+    )
+
+
+def _div_price(price: Price, other: Price) -> Decimal:
+    """Price / Price : retourne le ratio entre les deux prix."""
+    if other.price == 0:
+        raise ZeroDivisionError("Division par zéro interdite")
+    return price.price / other.price
+
+
+# Dispatch de Price.__mul__ selon le type exact de l'opérande
+_MUL_DISPATCH = {int: _mul_number, float: _mul_number, Token: _mul_token}
+
+# Dispatch de Price.__truediv__ selon le type exact de l'opérande
+_DIV_DISPATCH = {int: _div_number, float: _div_number, Price: _div_price}
+
+# Token * Price et Asset / Price sont enregistrés ici : coin.py et asset.py
+# ne peuvent pas importer Price sans cycle
+_TOKEN_MUL_DISPATCH[Price] = _token_mul_price
+_ASSET_DIV_DISPATCH[Price] = _asset_div_price
+
+# Liaison tardive des classes dont coin.py et asset.py ont besoin à l'exécution
+_coin_module.Price = Price
+_asset_module.Price = Price
@@ -0,0 +1,99 @@
+"""
+Columnar container for a series of prices of a single pair.
+
+A PriceArray stores the Decimal values in one list and the pair symbols
+once, instead of one Price object per tick. Aggregations run over the
+raw values; scalar Price objects are only built on demand.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Iterable, Iterator, List
+
+from python_trading_objects.quotes._kernels import Number, add_amounts, sum_amounts, to_decimals
+from python_trading_objects.quotes.price import Price
+
+
+class PriceArray:
+    """
+    Series of prices sharing the same base and quote symbols.
+    """
+
+    __slots__ = ("values", "base_symbol", "quote_symbol")
+
+    def __init__(self, values: Iterable[Number], base_symbol: str, quote_symbol: str):
+        """
+        Initializes a PriceArray.
+
+        Parameters:
+        values (Iterable[Decimal|float|int|str]): The price values.
+        base_symbol (str): The base currency symbol (e.g., BTC).
+        quote_symbol (str): The quote currency symbol (e.g., USD).
+        """
+        self.values: List[Decimal] = to_decimals(values)
+        self.base_symbol = Price.validate_symbols(base_symbol)
+        self.quote_symbol = Price.validate_symbols(quote_symbol)
+
+    @classmethod
+    def from_prices(cls, prices: Iterable[Price]) -> PriceArray:
+        """
+        Builds a PriceArray from existing Price instances.
+
+        Args:
+            prices: Prices of the same pair (at least one)
+
+        Returns:
+            PriceArray holding the price values
+
+        Raises:
+            ValueError: If no price is given or the symbols differ
+        """
+        prices = list(prices)
+        if not prices:
+            raise ValueError("Cannot build a PriceArray from an empty series")
+        base, quote = prices[0].base_symbol, prices[0].quote_symbol
+        for p in prices:
+            if p.base_symbol != base or p.quote_symbol != quote:
+                raise ValueError("All prices must share the same symbols")
+        return cls(Price.to_array(prices), base, quote)
+
+    def __len__(self) -> int:
+        """Returns the number of prices in the series."""
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Price:
+        """Returns the price at the given index as a Price."""
+        return Price._fast_new(self.values[index], self.base_symbol, self.quote_symbol)
+
+    def __add__(self, other: PriceArray) -> PriceArray:
+        """
+        Adds two series element-wise.
+
+        Raises:
+        ValueError: If the symbols or the lengths differ.
+        """
+        if not isinstance(other, PriceArray):
+            return NotImplemented
+        if other.base_symbol != self.base_symbol or other.quote_symbol != self.quote_symbol:
+            raise ValueError("Cannot add price series with different symbols")
+        return PriceArray(add_amounts(self.values, other.values), self.base_symbol, self.quote_symbol)
+
+    def mean(self) -> Price:
+        """
+        Returns the average price of the series.
+
+        Raises:
+        ValueError: If the series is empty.
+        """
+        if not self.values:
+            raise ValueError("Cannot compute the mean of an empty series")
+        return Price._fast_new(
+            sum_amounts(self.values) / len(self.values), self.base_symbol, self.quote_symbol
+        )
+
+    def to_prices(self) -> Iterator[Price]:
+        """Lazily yields one Price per value, for callers that need scalar objects."""
+        base, quote = self.base_symbol, self.quote_symbol
+        for value in self.values:
+            yield Price._fast_new(value, base, quote)
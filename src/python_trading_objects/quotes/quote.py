@@ -1,12 +1,14 @@
-import json
 from abc import ABC, abstractmethod
 from decimal import Decimal, ROUND_DOWN
-from typing import Any, ClassVar, Dict, Union
+from typing import Any, ClassVar, Dict, Iterable, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer
+from pydantic import ConfigDict, Field, field_validator, model_serializer
 
+from python_trading_objects.quotes._cached import _CachedModel
+from python_trading_objects.quotes._kernels import _QUANTIZERS, _quantizer_for, to_decimal
 
-class Quote(BaseModel, ABC):
+
+class Quote(_CachedModel, ABC):
     """
     Classe abstraite de base pour toutes les devises.
 
@@ -15,7 +17,7 @@ class Quote(BaseModel, ABC):
 
     # Configuration Pydantic
     model_config = ConfigDict(
-        validate_assignment=True,
+        frozen=True,
         arbitrary_types_allowed=True,
         extra="forbid",
     )
@@ -23,6 +25,23 @@ class Quote(BaseModel, ABC):
     # Précisions par défaut pour les classes de devise.
     precisions: ClassVar[Dict[str, int]] = {"Token": 5, "USD": 2}
 
+    # Précision de la classe et son quantizer, résolus une fois à sa définition
+    # (voir __init_subclass__) puis mis à jour par set_precision.
+    _class_precision: ClassVar[int] = 8
+    _class_quantizer: ClassVar[Decimal] = _QUANTIZERS[8]
+
+    def __init_subclass__(cls, **kwargs):
+        """Résout la précision de la classe fille à partir de Quote.precisions."""
+        super().__init_subclass__(**kwargs)
+        name = cls.__name__
+        cls._bind_precision(Quote.precisions.get(name, 8 if name == "Token" else 2))
+
+    @classmethod
+    def _bind_precision(cls, precision: int) -> None:
+        """Fixe la précision de la classe et le quantizer correspondant."""
+        cls._class_precision = precision
+        cls._class_quantizer = _quantizer_for(precision)
+
     # Champs Pydantic
     amount: Decimal = Field(..., description="Le montant de la devise")
     precision: int = Field(default=8, description="La précision numérique")
@@ -39,17 +58,13 @@ class Quote(BaseModel, ABC):
 
         # Convertir en Decimal si nécessaire
         if not isinstance(amount, Decimal):
-            amount = Decimal(str(amount))
+            amount = to_decimal(amount)
 
-        # Si precision n'est pas dans data, on la calcule
+        # Si precision n'est pas dans data, on prend celle de la classe fille
         if "precision" not in data:
-            child_class = self.__class__
-            # Détermine la précision en fonction du nom de la classe fille.
-            precision = Quote.precisions.get(
-                child_class.__name__, 8 if child_class.__name__ == "Token" else 2
-            )
+            precision = self._class_precision
             # Tronque le montant seulement si on calcule la précision nous-mêmes
-            truncated_amount = self._truncate_to_precision_static(amount, precision)
+            truncated_amount = amount.quantize(self._class_quantizer, rounding=ROUND_DOWN)
         else:
             precision = data.pop("precision")  # Retirer de data pour éviter les doublons
             # Ne pas retronquer - le montant a déjà été tronqué par la classe fille
@@ -65,16 +80,24 @@ class Quote(BaseModel, ABC):
         if isinstance(v, Decimal):
             return v
         if isinstance(v, (float, int, str)):
-            return Decimal(str(v))
+            return to_decimal(v)
         raise TypeError(f"Amount must be Decimal, float, int or str, got {type(v)}")
 
     @model_serializer
     def serialize_model(self) -> Dict[str, Any]:
-        """Sérialise le modèle avec les float en string pour préserver la précision."""
-        return {
-            "amount": str(self.amount),
-            "precision": self.precision,
-        }
+        """
+        Sérialise le modèle avec les float en string pour préserver la précision.
+
+        Le dictionnaire est construit au premier appel puis conservé dans
+        __dict__ (retiré des copies comme le hash) ; une copie est retournée.
+        """
+        cached = self.__dict__.get("_ser")
+        if cached is None:
+            cached = self.__dict__["_ser"] = {
+                "amount": str(self.amount),
+                "precision": self.precision,
+            }
+        return dict(cached)
 
     @staticmethod
     def _truncate_to_precision_static(amount: Union[Decimal, float, int], precision: int) -> Decimal:
@@ -89,10 +112,10 @@ class Quote(BaseModel, ABC):
         Decimal: Le montant tronqué.
         """
         if not isinstance(amount, Decimal):
-            amount = Decimal(str(amount))
+            amount = to_decimal(amount)
 
-        # Créer le quantizer basé sur la précision (ex: 0.01 pour precision=2)
-        quantizer = Decimal(10) ** -precision
+        # Quantizer basé sur la précision (ex: 0.01 pour precision=2)
+        quantizer = _quantizer_for(precision)
         # Tronquer vers le bas (ROUND_DOWN)
         return amount.quantize(quantizer, rounding=ROUND_DOWN)
 
@@ -118,17 +141,37 @@ class Quote(BaseModel, ABC):
         precision (int): La précision numérique à appliquer.
         """
         Quote.precisions[class_name] = precision
+        pending = list(Quote.__subclasses__())
+        while pending:
+            subclass = pending.pop()
+            if subclass.__name__ == class_name:
+                subclass._bind_precision(precision)
+            pending.extend(subclass.__subclasses__())
 
     def __eq__(self, other):
-        """Vérifie si deux instances de Quote sont égales en montant."""
-        from python_trading_objects.quotes.assertion import bot_assert
+        """
+        Vérifie si deux instances de Quote sont égales en montant.
 
-        bot_assert(other, Quote)
+        Retourne NotImplemented si 'other' n'est pas un Quote, pour que Python
+        applique son protocole (une comparaison avec un nombre vaut False).
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Quote):
+            return NotImplemented
         return self.amount == other.amount
 
     def __hash__(self):
-        """Rend la classe hashable pour utilisation dans des sets/dicts."""
-        return hash((self.__class__.__name__, self.amount))
+        """
+        Rend la classe hashable pour utilisation dans des sets/dicts.
+
+        Le hash est mis en cache au premier appel (voir _CachedModel).
+        """
+        cached = self.__dict__.get("_hash")
+        if cached is None:
+            cached = hash((self.__class__.__name__, self.amount))
+            self.__dict__["_hash"] = cached
+        return cached
 
     @abstractmethod
     def __str__(self):
@@ -175,8 +218,30 @@ class Quote(BaseModel, ABC):
         return {"price": str(self.amount)}
 
     def to_json(self):
-        """Convertit l'objet en JSON."""
-        return json.dumps(self.to_dict())
+        """
+        Convertit l'objet en JSON.
+
+        Le document n'a qu'une clé et str(Decimal) ne contient aucun caractère
+        à échapper : on le formate directement, sans passer par json.dumps.
+        """
+        return f'{{"price": "{self.amount}"}}'
+
+    @staticmethod
+    def dumps_many(quotes: Iterable[Any]) -> str:
+        """
+        Sérialise une série de devises (ou de Price) en un seul tableau JSON.
+
+        Chaque élément fournit déjà son document via to_json() ; la liste est
+        assemblée en une passe, sans dictionnaire intermédiaire. Le résultat
+        est identique à json.dumps([q.to_dict() for q in quotes]).
+
+        Paramètres:
+        quotes (Iterable): Objets exposant to_json() (Quote, Asset, Price...).
+
+        Retourne:
+        str: Le tableau JSON.
+        """
+        return "[" + ", ".join([q.to_json() for q in quotes]) + "]"
 
     def is_positive(self) -> bool:
         """
@@ -204,3 +269,18 @@ class Quote(BaseModel, ABC):
         bool: True si le montant est < 0, False sinon.
         """
         return self.amount < 0
+
+    def sign(self) -> int:
+        """
+        Retourne le signe du montant, pour traiter les trois cas en un seul appel.
+
+        Lu sur le Decimal (is_zero, is_signed) sans comparaison à un entier ;
+        -0 est considéré comme nul.
+
+        Retourne:
+        int: -1 si le montant est négatif, 0 s'il est nul, 1 s'il est positif.
+        """
+        amount = self.amount
+        if amount.is_zero():
+            return 0
+        return -1 if amount.is_signed() else 1
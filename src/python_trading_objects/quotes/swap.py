@@ -8,6 +8,8 @@ from typing import Any, Dict, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer
 
+_ZERO = Decimal(0)
+
 
 class SwapType(Enum):
     """Types of swaps available across exchanges."""
@@ -161,8 +163,8 @@ class SwapQuote(BaseModel):
     )
     from_symbol: str = Field(..., description="Symbol of the asset to swap from")
     to_symbol: str = Field(..., description="Symbol of the asset to swap to")
-    fees: Decimal = Field(default=Decimal("0"), description="Total fees (percentage or absolute)")
-    slippage: Decimal = Field(default=Decimal("0"), description="Expected slippage (DEX)")
+    fees: Decimal = Field(default=_ZERO, description="Total fees (percentage or absolute)")
+    slippage: Decimal = Field(default=_ZERO, description="Expected slippage (DEX)")
     gas_estimate: Optional[Decimal] = Field(
         default=None, description="Estimated gas cost (DEX only)"
     )
@@ -266,8 +268,8 @@ class SwapResult(BaseModel):
     gas_used: Optional[Decimal] = Field(
         default=None, description="Actual gas used (DEX only)"
     )
-    expected_rate: Decimal = Field(default=Decimal("0"), description="Expected rate")
-    slippage: Decimal = Field(default=Decimal("0"), description="Calculated slippage")
+    expected_rate: Decimal = Field(default=_ZERO, description="Expected rate")
+    slippage: Decimal = Field(default=_ZERO, description="Calculated slippage")
 
     def __init__(
             self,
@@ -302,11 +304,11 @@ class SwapResult(BaseModel):
         gas_used_dec = Decimal(str(gas_used)) if gas_used is not None and not isinstance(gas_used, Decimal) else gas_used
 
         # Calculate slippage from expected
-        expected_rate = to_amount_dec / from_amount_dec if from_amount_dec > 0 else Decimal("0")
+        expected_rate = to_amount_dec / from_amount_dec if from_amount_dec > 0 else _ZERO
         if expected_rate > 0 and executed_rate_dec > 0:
             slippage = abs((expected_rate - executed_rate_dec) / executed_rate_dec)
         else:
-            slippage = Decimal("0")
+            slippage = _ZERO
 
         super().__init__(
             request=request,
@@ -0,0 +1,134 @@
+"""
+Columnar container for a series of token amounts of a single base currency.
+
+A TokenArray stores the Decimal amounts in one list and the base symbol
+once, instead of one Token object per amount. Reductions and valuation run
+over the raw values and only build objects for the results.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Iterable, Iterator, List, Union
+
+from python_trading_objects.quotes._kernels import Number, add_amounts, mul_amounts, sum_amounts, truncate_amounts
+from python_trading_objects.quotes.asset_array import AssetArray
+from python_trading_objects.quotes.coin import Token
+from python_trading_objects.quotes.price import Price
+from python_trading_objects.quotes.price_array import PriceArray
+
+
+class TokenArray:
+    """
+    Series of token amounts sharing the same base symbol.
+
+    Amounts are truncated to the Token precision on construction, exactly
+    like individual Token instances.
+    """
+
+    __slots__ = ("values", "base_symbol", "precision")
+
+    def __init__(self, values: Iterable[Number], base_symbol: str):
+        """
+        Initializes a TokenArray.
+
+        Parameters:
+        values (Iterable[Decimal|float|int|str]): The token amounts.
+        base_symbol (str): The base currency symbol (e.g., BTC).
+
+        Raises:
+        ValueError: If base_symbol is empty, not a string or a pair (e.g., BTC/USDC).
+        """
+        # Same normalization as PriceArray, so base symbols compare by identity
+        symbol = Price.validate_symbols(base_symbol)
+        if "/" in symbol:
+            raise ValueError(f"Expected a base symbol, got the pair {base_symbol}")
+        self.precision = Token._class_precision
+        self.base_symbol = symbol
+        self.values: List[Decimal] = truncate_amounts(values, self.precision)
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[Token]) -> TokenArray:
+        """
+        Builds a TokenArray from existing Token instances.
+
+        Args:
+            tokens: Tokens with the same base symbol (at least one)
+
+        Returns:
+            TokenArray holding the amounts
+
+        Raises:
+            ValueError: If no token is given or the symbols differ
+        """
+        tokens = list(tokens)
+        if not tokens:
+            raise ValueError("Cannot build a TokenArray from an empty series")
+        base_symbol = tokens[0].base_symbol
+        if any(t.base_symbol != base_symbol for t in tokens):
+            raise ValueError("All tokens must share the same base symbol")
+        return cls([t.amount for t in tokens], base_symbol)
+
+    def __len__(self) -> int:
+        """Returns the number of amounts in the series."""
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Token:
+        """Returns the amount at the given index as a Token."""
+        return Token._fast_new(self.values[index], self.base_symbol)
+
+    def __add__(self, other: TokenArray) -> TokenArray:
+        """
+        Adds two series element-wise.
+
+        Raises:
+        ValueError: If the symbols or the lengths differ.
+        """
+        if not isinstance(other, TokenArray):
+            return NotImplemented
+        if other.base_symbol != self.base_symbol:
+            raise ValueError(f"Cannot add {self.base_symbol} with {other.base_symbol}")
+        return TokenArray(add_amounts(self.values, other.values), self.base_symbol)
+
+    def sum(self) -> Token:
+        """Returns the total of the series as a Token (zero if empty)."""
+        return Token._fast_new(sum_amounts(self.values), self.base_symbol)
+
+    def mark_to_market(self, prices: Union[Price, PriceArray]) -> AssetArray:
+        """
+        Values every amount in the quote currency.
+
+        Same amounts as Price * Token for each element, each truncated to the
+        quote asset precision.
+
+        Args:
+            prices: One Price for the whole series, or a PriceArray of the same length
+
+        Returns:
+            AssetArray of values in the quote currency
+
+        Raises:
+            ValueError: If the base symbols or the lengths differ
+        """
+        if prices.base_symbol != self.base_symbol:
+            raise ValueError(f"Cannot value {self.base_symbol} with a {prices.base_symbol} price")
+        if isinstance(prices, PriceArray):
+            values = mul_amounts(prices.values, self.values)
+        else:
+            price = prices.price
+            values = [price * a for a in self.values]
+        return AssetArray(values, prices.quote_symbol)
+
+    def __mul__(self, other: Union[Price, PriceArray]) -> AssetArray:
+        """Values the series like Token * Price (see mark_to_market)."""
+        if not isinstance(other, (Price, PriceArray)):
+            return NotImplemented
+        return self.mark_to_market(other)
+
+    __rmul__ = __mul__
+
+    def to_tokens(self) -> Iterator[Token]:
+        """Lazily yields one Token per amount, for callers that need scalar objects."""
+        base_symbol = self.base_symbol
+        for value in self.values:
+            yield Token._fast_new(value, base_symbol)
@@ -2,6 +2,8 @@
 Unit tests for the Asset class and its integration with BotPair.
 """
 
+from decimal import Decimal
+
 import pytest
 
 from python_trading_objects.quotes.asset import Asset
@@ -70,6 +72,22 @@ class TestAssetCreation:
         assert eur.is_stablecoin() == False
         assert btc.is_stablecoin() == False
 
+    def test_from_array_matches_factory(self):
+        """Test that batch creation truncates and classifies like the factory."""
+        from python_trading_objects.quotes.asset import USD
+
+        pair = BotPair("BTC/USDC")
+        assets = Asset.from_array([1.239, 100, "0.005"], "USDC")
+        assert [a.amount for a in assets] == [
+            pair.create_quote_asset(v).amount for v in (1.239, 100, "0.005")
+        ]
+        assert all(a.is_stablecoin() and a.precision == 2 for a in assets)
+        assert str(assets[0]) == "1.23 USDC"
+
+        btc = USD.from_array([0.123456789], "BTC")
+        assert isinstance(btc[0], USD)
+        assert btc[0].model_dump() == pair.create_base_asset(0.123456789).model_dump()
+
 
 class TestAssetArithmetic:
     """Tests for Asset arithmetic operations."""
@@ -96,6 +114,25 @@ class TestAssetArithmetic:
             eur + usd
         assert "Cannot add EUR with USD" in str(exc_info.value)
 
+    def test_asset_addition_with_non_asset_fails(self):
+        """Test that adding a non-Asset raises TypeError after the reflected attempt."""
+        eur = BotPair("BTC/EUR").create_quote_asset(1000.0)
+        with pytest.raises(TypeError):
+            eur + "1000"
+        with pytest.raises(TypeError):
+            eur - 1000.0
+
+    def test_usd_arithmetic_keeps_usd_class(self):
+        """Test that USD operands produce USD results."""
+        from python_trading_objects.quotes.asset import USD
+
+        pair = BotPair("BTC/USDT")
+        usdt = pair.create_usd(100.0)
+        assert isinstance(usdt + pair.create_quote_asset(1.0), USD)
+        assert isinstance(-usdt, USD)
+        assert isinstance(usdt * 2, USD)
+        assert str(usdt - usdt) == "0.00 USDT"
+
     def test_asset_subtraction(self):
         """Test subtracting assets of the same type."""
         pair = BotPair("ETH/USDC")
@@ -115,6 +152,14 @@ class TestAssetArithmetic:
         assert result.amount == 2500.0
         assert result.get_symbol() == "USD"
 
+    def test_asset_multiplication_by_non_number_fails(self):
+        """Test that multiplying by a non-number raises TypeError."""
+        usd = BotPair("BTC/USD").create_quote_asset(1000.0)
+        with pytest.raises(TypeError):
+            usd * "2"
+        with pytest.raises(TypeError):
+            usd * usd
+
     def test_asset_division_by_float(self):
         """Test dividing asset by a float."""
         pair = BotPair("ETH/EUR")
@@ -124,6 +169,16 @@ class TestAssetArithmetic:
         assert result.amount == 2500.0
         assert result.get_symbol() == "EUR"
 
+    def test_asset_division_operand_types(self):
+        """Test division dispatch for Decimal, Asset and invalid operands."""
+        pair = BotPair("ETH/EUR")
+        eur = pair.create_quote_asset(10.0)
+
+        assert (eur / Decimal("4")).amount == Decimal("2.50")
+        assert eur / pair.create_quote_asset(4.0) == Decimal("2.5")
+        with pytest.raises(TypeError):
+            eur / "2"
+
     def test_asset_division_by_price(self):
         """Test dividing asset by price to get tokens."""
         pair = BotPair("BTC/USD")
@@ -144,6 +199,21 @@ class TestAssetArithmetic:
         assert result.amount == -1000.0
         assert result.get_symbol() == "EUR"
 
+    def test_same_precision_results_keep_precision(self):
+        """Test that add/sub/neg results keep the operands' precision without re-truncation."""
+        pair = BotPair("BTC/EUR")
+        a = pair.create_quote_asset(10.25)
+        b = pair.create_quote_asset(0.5)
+
+        for result in (a + b, a - b, -a):
+            assert result.precision == 2
+            assert result.amount.as_tuple().exponent == -2
+        assert str(a + b) == "10.75 EUR"
+
+        # Operands of different precision are still truncated
+        loose = Asset(Decimal("0.12345678"), "eur", _from_factory=True)
+        assert (a + loose).amount == Decimal("10.37")
+
 
 class TestAssetComparison:
     """Tests for Asset comparison operations."""
@@ -183,6 +253,18 @@ class TestAssetComparison:
             eur < usd
         assert "Cannot compare EUR with USD" in str(exc_info.value)
 
+    def test_asset_comparison_defers_to_reflected_operand(self):
+        """Test that unsupported operands fall back to the reflected comparison."""
+
+        class Ceiling:
+            def __gt__(self, other):
+                return True
+
+        usdc = BotPair("ETH/USDC").create_quote_asset(1000.0)
+        assert usdc < Ceiling()
+        with pytest.raises(TypeError):
+            usdc < "1000"
+
 
 class TestAssetFormatting:
     """Tests for Asset string formatting."""
@@ -216,6 +298,16 @@ class TestAssetFormatting:
         eth = pair.create_base_asset(10.0)
         assert str(eth) == "10.00000000 ETH"
 
+    def test_asset_is_frozen(self):
+        """Test that the amount cannot be reassigned, so the cached string stays valid."""
+        from pydantic import ValidationError
+
+        eur = BotPair("BTC/EUR").create_quote_asset(5.0)
+        assert str(eur) == "5.00 EUR"
+        with pytest.raises(ValidationError):
+            eur.amount = Decimal("7.5")
+        assert str(eur) == "5.00 EUR"
+
 
 class TestBackwardCompatibility:
     """Tests for backward compatibility with USD class."""
@@ -282,6 +374,16 @@ class TestAssetSerialization:
         assert data["price"] == "5000.00"
         assert data["symbol"] == "USDC"
 
+    def test_asset_to_json_matches_json_dumps(self):
+        """Test that the formatted JSON is identical to json.dumps of to_dict."""
+        import json
+
+        for asset in (
+            BotPair("BTC/EUR").create_quote_asset(-1.5),
+            BotPair('BTC/É"\\').create_quote_asset(2),
+        ):
+            assert asset.to_json() == json.dumps(asset.to_dict())
+
 
 class TestExoticPairs:
     """Tests for non-standard trading pairs."""
@@ -0,0 +1,56 @@
+"""Unit tests for AssetArray"""
+from decimal import Decimal
+
+import pytest
+
+from python_trading_objects.quotes import AssetArray, BotPair
+from python_trading_objects.quotes.asset import Asset
+
+
+@pytest.fixture
+def bot_pair():
+    return BotPair("BTC/USDC")
+
+
+def test_create_quote_asset_array_truncates_like_assets(bot_pair):
+    """Test that amounts are truncated to the asset precision."""
+    amounts = bot_pair.create_quote_asset_array([1.239, 100, "0.005"])
+    assert amounts.symbol == "USDC"
+    assert amounts.values == [Decimal("1.23"), Decimal("100.00"), Decimal("0.00")]
+    assert amounts[0].model_dump() == bot_pair.create_quote_asset(1.239).model_dump()
+
+
+def test_asset_array_reductions(bot_pair):
+    """Test sum, mean and element-wise addition."""
+    amounts = bot_pair.create_quote_asset_array([10, 20, 30.5])
+    assert amounts.sum() == bot_pair.create_quote_asset(60.5)
+    assert str(amounts.mean()) == "20.16 USDC"
+    assert (amounts + amounts).values == [Decimal("20.00"), Decimal("40.00"), Decimal("61.00")]
+    assert bot_pair.create_quote_asset_array([]).sum().amount == 0
+    with pytest.raises(ValueError):
+        amounts + AssetArray([1, 2, 3], "EUR")
+
+
+def test_asset_array_round_trip_and_truncate(bot_pair):
+    """Test conversion from and to Asset instances and coarser truncation."""
+    assets = [bot_pair.create_base_asset(v) for v in (0.123456789, 1.5)]
+    array = AssetArray.from_assets(assets)
+    assert list(array.to_assets()) == assets
+    truncated = array.truncate(2)
+    assert truncated.values == [Decimal("0.12"), Decimal("1.50")]
+    assert truncated.precision == 2
+    assert truncated.truncate(2).precision == 2
+    with pytest.raises(ValueError):
+        truncated.truncate(3)
+    with pytest.raises(ValueError):
+        AssetArray.from_assets([assets[0], bot_pair.create_quote_asset(1)])
+
+
+def test_asset_array_from_assets_keeps_array_precision(bot_pair):
+    """Test that amounts are only re-truncated when the asset precision differs."""
+    assets = [bot_pair.create_quote_asset(v) for v in (1.23, 4.5)]
+    assert AssetArray.from_assets(assets).values == [a.amount for a in assets]
+
+    # Lowercase symbols are classified before normalization (precision 8)
+    loose = Asset(Decimal("1.23999"), "usdc", _from_factory=True)
+    assert AssetArray.from_assets([loose]).values == [Decimal("1.23")]
@@ -60,6 +60,19 @@ def test_token_less_than_float(bot_pair):
     assert not (token < 5.0)
 
 
+def test_token_ordering_comparisons(bot_pair):
+    """Test <=, > and >= between Token instances and numbers."""
+    token1 = bot_pair.create_token(5.0)
+    token2 = bot_pair.create_token(10.0)
+    assert token1 <= token2
+    assert token1 <= bot_pair.create_token(5.0)
+    assert token2 > token1
+    assert token2 >= token1
+    assert token1 >= 5.0
+    assert token1 > 4
+    assert not (token1 > 5.0)
+
+
 def test_token_add_tokens(bot_pair):
     """Test addition of two Token instances."""
     token1 = bot_pair.create_token(5.0)
@@ -165,3 +178,39 @@ def test_token_to_json(bot_pair):
     result = json.loads(token.to_json())
     assert isinstance(result["price"], str)
     assert result["price"] == "1.23000"
+
+
+def test_token_arithmetic_result_matches_factory_token(bot_pair):
+    """Test that arithmetic results built without re-validation behave like factory Tokens."""
+    result = bot_pair.create_token(1.123456) + bot_pair.create_token(2.0)
+    assert isinstance(result.amount, Decimal)
+    assert result.model_dump() == bot_pair.create_token(3.12345).model_dump()
+    assert (bot_pair.create_token(1.0) / 3).amount == Decimal("0.33333")
+
+
+def test_token_base_symbol_is_interned():
+    """Test that Tokens share the interned base symbol, even when built from a runtime string."""
+    symbol = "".join(["B", "TC"])
+    token = Token(1.0, symbol, _from_factory=True)
+    assert token.base_symbol is BotPair("BTC/USD").create_token(2.0).base_symbol
+
+
+def test_token_truediv_operand_subclasses(bot_pair):
+    """Test that operand subclasses missing from the dispatch table still divide."""
+
+    class Ratio(Decimal):
+        pass
+
+    token = bot_pair.create_token(10.0)
+    assert token / Ratio(4) == bot_pair.create_token(2.5)
+    with pytest.raises(TypeError):
+        _ = token / "2"
+
+
+@pytest.mark.parametrize("symbol", [123, None])
+def test_token_invalid_base_symbol_raises_validation_error(symbol):
+    """Test that an invalid base symbol is reported by the model validation."""
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError):
+        Token(1, symbol, _from_factory=True)
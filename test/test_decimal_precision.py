@@ -155,6 +155,14 @@ class TestDecimalNotFloat:
         # Not float
         assert not isinstance(increased.price, float)
 
+    def test_int_and_float_inputs_convert_exactly(self, bot_pair):
+        """Verify ints convert without a string round-trip and floats keep their repr"""
+        big = 12345678901234567890
+        assert bot_pair.create_price(big).price == Decimal(big)
+        assert bot_pair.create_price(0.1).price == Decimal("0.1")
+        assert (bot_pair.create_price(100) * 3).price == Decimal("300")
+        assert (bot_pair.create_token(1) * 0.1).amount == Decimal("0.10000")
+
     def test_token_split_uses_decimal(self, bot_pair):
         """Verify Token split returns Decimal"""
         token = bot_pair.create_token(Decimal("1.0"))
@@ -168,6 +176,24 @@ class TestDecimalNotFloat:
         assert not isinstance(first.amount, float)
         assert not isinstance(second.amount, float)
 
+    def test_float_operands_use_shortest_repr(self, bot_pair):
+        """Verify float operands convert through their repr, also on repeated (memoized) calls"""
+        token = bot_pair.create_token(Decimal("1.0"))
+
+        for _ in range(2):
+            first, second = token.split(0.3)
+            assert first.amount == Decimal("0.3")
+            assert second.amount == Decimal("0.7")
+            assert (token * 0.1).amount == Decimal("0.1")
+
+    @pytest.mark.parametrize("values", [(-0.0, 0.0), (0.0, -0.0)])
+    def test_float_signed_zeros_keep_their_sign(self, values):
+        """Verify 0.0 and -0.0 convert to their own Decimal whatever the call order"""
+        from python_trading_objects.quotes._kernels import to_decimal
+
+        for _ in range(2):
+            assert [str(to_decimal(v)) for v in values] == [repr(v) for v in values]
+
     def test_no_float_in_intermediate_calculations(self, bot_pair):
         """
         Verify we don't convert to float for intermediate calculations.
@@ -1,3 +1,7 @@
+import pickle
+
+import pytest
+
 from python_trading_objects.quotes import USD, BotPair, Price, Token
 
 
@@ -66,3 +70,54 @@ def test_bot_pair_zero_price():
     assert zero_price.price == 0.0
     assert zero_price.get_base() == "SOL"
     assert zero_price.get_quote() == "CAD"
+
+
+def test_bot_pair_has_no_instance_dict():
+    """Test that BotPair uses __slots__ instead of a per-instance __dict__."""
+    pair = BotPair("BTC/USD")
+    assert not hasattr(pair, "__dict__")
+
+
+def test_bot_pair_reuses_parsed_symbols():
+    """Test that pairs built from the same string share the parsed symbols."""
+    first = BotPair("ETH/USDC")
+    second = BotPair("ETH/USDC")
+    assert (second.base_symbol, second.quote_symbol) == ("ETH", "USDC")
+    assert first.base_symbol is second.base_symbol
+    assert first.quote_symbol is second.quote_symbol
+    with pytest.raises(ValueError):
+        BotPair("ETHUSDC")
+
+
+def test_bot_pair_zero_factories_return_fresh_instances():
+    """Test that zero factories match the regular factories and are not shared."""
+    pair = BotPair("ETH/USDC")
+    assert pair.zero_quote().model_dump() == pair.create_quote_asset(0).model_dump()
+    assert str(pair.zero_base()) == str(pair.create_base_asset(0))
+    assert pair.zero_price() is not pair.zero_price()
+    assert pair.zero_price().price == 0
+
+
+def test_bot_pair_get_returns_shared_instance():
+    """Test that BotPair.get reuses one instance per pair string."""
+    pair = BotPair.get("SOL/USDT")
+    assert pair is BotPair.get("SOL/USDT")
+    assert pair is not BotPair.get("SOL/EUR")
+    assert (pair.base_symbol, pair.quote_symbol) == ("SOL", "USDT")
+    assert pair.create_price(10).base_symbol is pair.base_symbol
+
+
+def test_bot_pair_get_instance_is_read_only():
+    """Test that shared pairs reject attribute changes while regular pairs do not."""
+    pair = BotPair.get("SOL/USDT")
+    with pytest.raises(AttributeError):
+        pair.quote_symbol = "X"
+    with pytest.raises(AttributeError):
+        del pair.friendly_name
+    assert BotPair.get("SOL/USDT").quote_symbol == "USDT"
+
+    assert pickle.loads(pickle.dumps(pair)) is pair
+
+    own = BotPair("SOL/USDT")
+    own.friendly_name = "Solana"
+    assert own.friendly_name == "Solana"
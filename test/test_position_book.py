@@ -0,0 +1,179 @@
+"""Unit tests for PositionBook"""
+from decimal import Decimal
+
+import pytest
+
+from python_trading_objects.domain.position_book import PositionBook
+from python_trading_objects.domain.position_calculator import PositionCalculator
+from python_trading_objects.domain.trading_position import TradingPosition
+from python_trading_objects.quotes.pair import BotPair
+
+
+class TestPositionBook:
+    """Test suite for PositionBook"""
+
+    @pytest.fixture
+    def bot_pair(self):
+        """Create a BotPair for testing"""
+        return BotPair("BTC/USDT")
+
+    @pytest.fixture
+    def positions(self, bot_pair):
+        """Create sample positions for testing"""
+        return [
+            TradingPosition(
+                id=f"pos-{i}",
+                pair=bot_pair,
+                purchase_price=bot_pair.create_price(price),
+                number_of_tokens=bot_pair.create_token(tokens),
+                expected_sale_price=bot_pair.create_price(price * 1.02),
+                next_purchase_price=bot_pair.create_price(price * 0.98),
+                variations={"buy": 0.02, "sell": 0.02}
+            )
+            for i, (price, tokens) in enumerate([(50000, 0.1), (52000, 0.05), (48000, 0.15)], start=1)
+        ]
+
+    def test_columns_follow_positions(self, positions, bot_pair):
+        """Test that the amount columns match the positions"""
+        book = PositionBook(bot_pair, positions)
+
+        assert len(book) == 3
+        assert book.tokens == tuple(p.number_of_tokens.amount for p in positions)
+        assert book.costs == tuple(p.cost_basis.amount for p in positions)
+        assert "pos-2" in book
+        assert book.get("pos-2") is positions[1]
+
+    def test_columns_are_read_only(self, positions, bot_pair):
+        """Test that the columns cannot be edited behind the book's back"""
+        book = PositionBook(bot_pair, positions)
+        version = book.version
+
+        with pytest.raises(TypeError):
+            book.sale_prices[0] = Decimal("1")
+        with pytest.raises(AttributeError):
+            book.tokens = ()
+
+        assert book.version == version
+        assert book.sale_prices[0] == positions[0].expected_sale_price.price
+
+    def test_remove_moves_last_position(self, positions, bot_pair):
+        """Test that removal keeps columns and index consistent"""
+        book = PositionBook(bot_pair, positions)
+
+        removed = book.remove("pos-1")
+
+        assert removed is positions[0]
+        assert "pos-1" not in book
+        assert list(book) == [positions[2], positions[1]]
+        assert book.tokens == (positions[2].number_of_tokens.amount, positions[1].number_of_tokens.amount)
+        assert book.get("pos-3") is positions[2]
+
+        book.remove("pos-2")
+        book.remove("pos-3")
+        assert len(book) == 0 and book.costs == ()
+
+    def test_sell_and_dca_candidates(self, positions, bot_pair):
+        """Test that candidate scans match the per-position predicates"""
+        book = PositionBook(bot_pair, positions)
+
+        for value in (40000, 48960, 49000, 51000, 53040, 60000):
+            price = bot_pair.create_price(value)
+            assert book.sell_candidates(price) == [i for i, p in enumerate(book) if p.should_sell_at(price)]
+            assert book.dca_candidates(price) == [i for i, p in enumerate(book) if p.should_buy_dca_at(price)]
+
+        book.remove("pos-1")
+        assert [book[i].id for i in book.sell_candidates(bot_pair.create_price(52000))] == ["pos-3"]
+
+    def test_apply_trailing_stop_matches_positions(self, positions, bot_pair):
+        """Test that the book trailing stop matches TradingPosition.apply_trailing_stop"""
+        book = PositionBook(bot_pair, positions)
+        current_price = bot_pair.create_price(52500)
+
+        updated = book.apply_trailing_stop(current_price, 0.02)
+
+        expected = [p.apply_trailing_stop(current_price, 0.02) for p in positions]
+        assert updated == [0, 2]
+        assert book.sale_prices == tuple(p.expected_sale_price.price for p in expected)
+        assert [p.expected_sale_price for p in book.snapshot()] == [p.expected_sale_price for p in expected]
+        assert book.get("pos-2") is positions[1]
+
+    def test_remove_after_trailing_stop(self, positions, bot_pair):
+        """Test that pending trailing stop updates follow rows moved by remove"""
+        book = PositionBook(bot_pair, positions)
+        book.apply_trailing_stop(bot_pair.create_price(52500), 0.02)
+
+        removed = book.remove("pos-2")
+
+        assert removed is positions[1]
+        assert book[1].id == "pos-3"
+        assert book[1].expected_sale_price.price == book.sale_prices[1] == Decimal("51450")
+
+    def test_version_and_memoized_roi(self, positions, bot_pair):
+        """Test that mutations bump the version and invalidate the memoized ROI"""
+        book = PositionBook(bot_pair, positions[:2])
+        current_price = bot_pair.create_price(51000)
+        version = book.version
+
+        roi = PositionCalculator.aggregate_roi(book, current_price)
+        assert PositionCalculator.aggregate_roi(book, current_price) == roi
+        assert book.version == version
+
+        book.add(positions[2])
+        assert book.version == version + 1
+        assert PositionCalculator.aggregate_roi(book, current_price) == \
+            PositionCalculator.aggregate_roi(positions, current_price)
+
+        book.apply_trailing_stop(bot_pair.create_price(1), 0.02)  # nothing raised
+        assert book.version == version + 1
+
+    def test_memoize_until_mutation(self, positions, bot_pair):
+        """Test that memoize computes once per key until the book changes"""
+        book = PositionBook(bot_pair, positions[:2])
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(book)
+
+        assert book.memoize("size", compute) == book.memoize("size", compute) == 2
+        book.add(positions[2])
+        assert book.memoize("size", compute) == 3
+        assert len(calls) == 2
+
+    def test_remove_unknown_id(self, bot_pair):
+        """Test that removing an unknown id raises KeyError"""
+        with pytest.raises(KeyError):
+            PositionBook(bot_pair).remove("missing")
+
+    def test_add_rejects_duplicates_and_other_pairs(self, positions, bot_pair):
+        """Test add validation"""
+        book = PositionBook(bot_pair, positions)
+        with pytest.raises(ValueError, match="already in the book"):
+            book.add(positions[0])
+
+        eth = BotPair("ETH/USDT")
+        other = TradingPosition(
+            id="eth-1",
+            pair=eth,
+            purchase_price=eth.create_price(3000),
+            number_of_tokens=eth.create_token(1),
+            expected_sale_price=eth.create_price(3100),
+            next_purchase_price=eth.create_price(2900),
+            variations={}
+        )
+        with pytest.raises(ValueError, match="Cannot add a ETH/USDT position"):
+            book.add(other)
+
+    def test_calculator_accepts_book(self, positions, bot_pair):
+        """Test that calculator results are identical for a book and a list"""
+        book = PositionBook(bot_pair, positions)
+        current_price = bot_pair.create_price(51234.56)
+
+        assert PositionCalculator.total_value(book, current_price) == \
+            PositionCalculator.total_value(positions, current_price)
+        assert PositionCalculator.total_cost_basis(book) == PositionCalculator.total_cost_basis(positions)
+        assert PositionCalculator.weighted_average_price(book) == \
+            PositionCalculator.weighted_average_price(positions)
+        assert PositionCalculator.aggregate_roi(book, current_price) == \
+            PositionCalculator.aggregate_roi(positions, current_price)
+        assert PositionCalculator.aggregate_roi(PositionBook(bot_pair), current_price) == 0.0
@@ -1,4 +1,6 @@
 """Unit tests for PositionCalculator"""
+from decimal import Decimal
+
 import pytest
 
 from python_trading_objects.domain.position_calculator import PositionCalculator
@@ -69,6 +71,16 @@ class TestPositionCalculator:
         assert float(total.amount) == 0
         assert total.symbol == "USDT"
 
+    def test_empty_totals_are_independent_zeros(self, bot_pair):
+        """Test that empty-list totals are distinct zero assets with the symbol precision"""
+        current_price = bot_pair.create_price(50000)
+        first = PositionCalculator.total_value([], current_price)
+        second = PositionCalculator.total_value([], current_price)
+
+        assert first == second and first is not second
+        assert first.amount == Decimal("0") and first.precision == 2
+        assert PositionCalculator.total_cost_basis([]).is_stablecoin()
+
     def test_total_cost_basis(self, positions):
         """Test calculating total cost basis"""
         total_cost = PositionCalculator.total_cost_basis(positions)
@@ -100,6 +112,25 @@ class TestPositionCalculator:
         assert avg_price.base_symbol == "BTC"
         assert avg_price.quote_symbol == "USDT"
 
+    def test_weighted_average_price_is_exact_decimal(self, bot_pair):
+        """Test that the weighted average keeps exact Decimal sums (no float drift)"""
+        positions = [
+            TradingPosition(
+                id=f"pos-{i}",
+                pair=bot_pair,
+                purchase_price=bot_pair.create_price(0.1),
+                number_of_tokens=bot_pair.create_token(1),
+                expected_sale_price=bot_pair.create_price(0.2),
+                next_purchase_price=bot_pair.create_price(0.05),
+                variations={}
+            )
+            for i in range(10)
+        ]
+
+        avg_price = PositionCalculator.weighted_average_price(positions)
+
+        assert avg_price.price == Decimal("0.1")
+
     def test_weighted_average_price_empty_list(self):
         """Test weighted average with empty positions list"""
         with pytest.raises(ValueError, match="Cannot calculate average of empty positions"):
@@ -223,3 +254,41 @@ class TestPositionCalculator:
 
         # Should match aggregate_roi
         assert abs(aggregate_roi - manual_roi) < 0.01
+
+    def test_totals_match_per_position_values(self, positions, bot_pair):
+        """Test that aggregates equal the sum of per-position Asset values exactly"""
+        current_price = bot_pair.create_price(51234.567)
+
+        total_value = PositionCalculator.total_value(positions, current_price)
+        total_cost = PositionCalculator.total_cost_basis(positions)
+
+        assert total_value.amount == sum(p.calculate_gross_value(current_price).amount for p in positions)
+        assert total_cost.amount == sum(p.cost_basis.amount for p in positions)
+
+    def test_usd_values_ignore_usd_class_precision(self):
+        """Test that USD totals follow Price * Token even after Quote.set_precision("USD", ...)"""
+        from python_trading_objects.quotes.quote import Quote
+
+        pair = BotPair("BTC/USD")
+        original_precision = Quote.precisions.get("USD")
+        Quote.set_precision("USD", 4)
+        try:
+            position = TradingPosition(
+                id="usd-1",
+                pair=pair,
+                purchase_price=pair.create_price(31234.5678),
+                number_of_tokens=pair.create_token(0.12345),
+                expected_sale_price=pair.create_price(32000),
+                next_purchase_price=pair.create_price(30000),
+                variations={}
+            )
+            current_price = pair.create_price(50234.5678)
+            cost = position.cost_basis.amount
+            value = position.calculate_gross_value(current_price).amount
+
+            assert PositionCalculator.total_cost_basis([position]).amount == cost
+            assert PositionCalculator.total_value([position], current_price).amount == value
+            assert PositionCalculator.aggregate_roi([position], current_price) == \
+                float((value - cost) / cost * 100)
+        finally:
+            Quote.set_precision("USD", original_precision)
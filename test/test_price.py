@@ -94,6 +94,13 @@ def test_price_division_by_zero_price_raises_error(bot_pair):
         _ = price1 / price2
 
 
+def test_price_division_by_unsupported_type_raises_error(bot_pair):
+    """Test that dividing a Price by a non-numeric operand raises a TypeError."""
+    price = bot_pair.create_price(100.0)
+    with pytest.raises(TypeError):
+        _ = price / "2"
+
+
 def test_price_mul_by_float(bot_pair):
     """Test multiplication of a Price by a float."""
     price = bot_pair.create_price(20000.0)
@@ -178,3 +185,68 @@ def test_price_zero_constant(bot_pair):
     assert bot_pair.zero_price().get_quote() == "USD"
     # Ensure it's indeed a Price instance
     assert isinstance(bot_pair.zero_price(), Price)
+
+
+def test_price_add_non_price_raises_error(bot_pair):
+    """Test that adding a non-Price operand raises a TypeError."""
+    price = bot_pair.create_price(100.0)
+    with pytest.raises(TypeError):
+        _ = price + 5.0
+
+
+def test_price_comparison_with_non_price(bot_pair):
+    """Test that comparing a Price with a non-Price defers to Python's protocol."""
+    price = bot_pair.create_price(100.0)
+    assert not (price == 100.0)
+    assert price != 100.0
+    with pytest.raises(TypeError):
+        _ = price < 100.0
+
+
+def test_price_arithmetic_result_is_validated_price(bot_pair):
+    """Test that arithmetic results built without re-validation behave like regular Prices."""
+    from decimal import Decimal
+
+    result = bot_pair.create_price(100.0) + bot_pair.create_price(50.5)
+    assert isinstance(result.price, Decimal)
+    assert result.model_dump() == {"price": "150.5", "base_symbol": "BTC", "quote_symbol": "USD"}
+    assert result == bot_pair.create_price(150.5)
+
+
+def test_price_hash_cache_not_copied(bot_pair):
+    """Test that the cached hash is not carried over to updated copies."""
+    from decimal import Decimal
+
+    price = bot_pair.create_price(100.0)
+    assert {price: "cached"}[bot_pair.create_price(100.0)] == "cached"
+    copied = price.model_copy(update={"price": Decimal("300")})
+    assert hash(copied) == hash(bot_pair.create_price(300.0))
+    assert "_hash" not in price.model_dump()
+
+
+def test_price_is_frozen(bot_pair):
+    """Test that fields cannot be reassigned, so the cached string stays valid."""
+    from decimal import Decimal
+
+    from pydantic import ValidationError
+
+    price = bot_pair.create_price(100.0)
+    assert str(price) == "100.00 BTC/USD"
+    assert str(price) is str(price)
+    with pytest.raises(ValidationError):
+        price.price = Decimal("200.5")
+    assert str(price) == "100.00 BTC/USD"
+
+
+def test_price_symbols_are_interned():
+    """Test that normalized symbols are shared between Prices of the same pair."""
+    first = BotPair("btc/usd").create_price(1.0)
+    second = BotPair("BTC/USD").create_price(2.0)
+    assert first.base_symbol is second.base_symbol
+    assert first.quote_symbol is second.quote_symbol
+
+
+def test_price_sign(bot_pair):
+    """Test the sign of positive, zero and negative prices."""
+    assert [bot_pair.create_price(v).sign() for v in (100, 0, -1)] == [1, 0, -1]
+    assert (bot_pair.create_price(1) - bot_pair.create_price(1)).sign() == 0
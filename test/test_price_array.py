@@ -0,0 +1,43 @@
+"""Unit tests for PriceArray"""
+from decimal import Decimal
+
+import pytest
+
+from python_trading_objects.quotes import BotPair, Price, PriceArray
+
+
+@pytest.fixture
+def bot_pair():
+    return BotPair("BTC/USDT")
+
+
+def test_create_price_array(bot_pair):
+    """Test that the factory builds a series sharing the pair symbols."""
+    prices = bot_pair.create_price_array([100, 101.5, "102.25"])
+    assert isinstance(prices, PriceArray)
+    assert len(prices) == 3
+    assert prices.values == [Decimal("100"), Decimal("101.5"), Decimal("102.25")]
+    assert prices[1] == bot_pair.create_price(101.5)
+    assert prices.base_symbol == "BTC" and prices.quote_symbol == "USDT"
+
+
+def test_price_array_add_and_mean(bot_pair):
+    """Test element-wise addition and average."""
+    a = bot_pair.create_price_array([100, 200])
+    b = bot_pair.create_price_array([1, 2])
+    assert (a + b).values == [Decimal("101"), Decimal("202")]
+    assert a.mean() == bot_pair.create_price(150)
+    with pytest.raises(ValueError):
+        a + BotPair("ETH/USDT").create_price_array([1, 2])
+    with pytest.raises(ValueError):
+        bot_pair.create_price_array([]).mean()
+
+
+def test_price_array_round_trip(bot_pair):
+    """Test conversion from and to scalar Price instances."""
+    prices = [bot_pair.create_price(v) for v in (1, 2, 3)]
+    array = PriceArray.from_prices(prices)
+    assert list(array.to_prices()) == prices
+    assert all(isinstance(p, Price) for p in array.to_prices())
+    with pytest.raises(ValueError):
+        PriceArray.from_prices([prices[0], BotPair("ETH/USDT").create_price(1)])
@@ -140,3 +140,33 @@ class TestPriceEnhancements:
         # Check precision maintained
         assert isinstance(result.price, Decimal)
         assert float(result.price) > 100.123
+
+    def test_from_array_and_to_array(self):
+        """Test building Prices from a series of values and back"""
+        prices = Price.from_array([100, 100.5, "101.25"], "btc", "usdt")
+
+        assert all(isinstance(p, Price) for p in prices)
+        assert prices[0].get_base() == "BTC"
+        assert prices[0].get_quote() == "USDT"
+        assert Price.to_array(prices) == [Decimal("100"), Decimal("100.5"), Decimal("101.25")]
+
+    def test_batch_add(self):
+        """Test element-wise addition of price series"""
+        a = Price.to_array(Price.from_array([100, 200], "BTC", "USDT"))
+        b = Price.to_array(Price.from_array([1.5, 2.5], "BTC", "USDT"))
+
+        assert Price.batch_add(a, b) == [Decimal("101.5"), Decimal("202.5")]
+
+        with pytest.raises(ValueError, match="same length"):
+            Price.batch_add(a, b[:1])
+
+    def test_batch_mul(self, bot_pair):
+        """Test element-wise valuation matches Price * Token"""
+        prices = [bot_pair.create_price(v) for v in (51234.567, 100)]
+        tokens = [bot_pair.create_token(v) for v in (0.12345, 3)]
+
+        values = Price.batch_mul(Price.to_array(prices), [t.amount for t in tokens], "USDT")
+        assert values == [(p * t).amount for p, t in zip(prices, tokens)]
+
+        with pytest.raises(ValueError, match="same length"):
+            Price.batch_mul(Price.to_array(prices), [], "USDT")
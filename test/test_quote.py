@@ -6,6 +6,7 @@ import pytest
 
 from python_trading_objects.quotes import (  # Pour tester les classes filles concrètes
     BotPair, Quote, Token)
+from python_trading_objects.quotes._kernels import _quantizer_for
 from python_trading_objects.quotes.assertion import bot_assert
 
 
@@ -74,6 +75,38 @@ def test_quote_truncate_to_precision_token(bot_pair):
     Quote.set_precision("Token", original_precision)  # Restore
 
 
+def test_quote_set_precision_applies_to_arithmetic_results(bot_pair):
+    """Test that set_precision reaches both factory tokens and arithmetic results."""
+    original_precision = Quote.precisions.get("Token")
+    Quote.set_precision("Token", 3)
+    try:
+        assert bot_pair.create_token(1.23456).amount == Decimal("1.234")
+        result = bot_pair.create_token(1) / 3
+        assert result.amount == Decimal("0.333")
+        assert result.precision == 3
+    finally:
+        Quote.set_precision("Token", original_precision)  # Restore
+    assert bot_pair.create_token(1.23456).precision == original_precision
+
+
+def test_quote_set_precision_updates_class_quantizer():
+    """Test that set_precision keeps the precomputed class quantizer in sync."""
+    original_precision = Quote.precisions.get("Token")
+    Quote.set_precision("Token", 3)
+    try:
+        assert Token._class_quantizer == Decimal("0.001")
+    finally:
+        Quote.set_precision("Token", original_precision)  # Restore
+    assert Token._class_quantizer == Decimal(10) ** -original_precision
+
+
+def test_quote_truncate_beyond_precomputed_quantizers():
+    """Test truncation at a precision outside the precomputed quantizer table."""
+    value = Decimal("1.123456789012345678901")
+    assert Quote._truncate_to_precision_static(value, 20) == Decimal("1.12345678901234567890")
+    assert _quantizer_for(20) is _quantizer_for(20)
+
+
 def test_quote_truncate_to_precision_usd(bot_pair):
     """Test value truncation for USD precision."""
     # Temporarily set precision for the specific truncation test
@@ -86,13 +119,13 @@ def test_quote_truncate_to_precision_usd(bot_pair):
     Quote.set_precision("USD", original_precision)  # Restore
 
 
-def test_quote_equality_different_types_raises_error(bot_pair):
-    """Test that equality comparison between Quote and non-Quote type raises a TypeError."""
+def test_quote_equality_with_non_quote_is_false(bot_pair):
+    """Test that equality comparison between Quote and non-Quote type follows Python's protocol."""
     token = bot_pair.create_token(10.0)
-    # Manually escape special characters for regex matching
-    expected_error_message_regex = r"Le paramètre doit être de type <class 'python_trading_objects\.quotes\.quote\.Quote'>"
-    with pytest.raises(TypeError, match=expected_error_message_regex):
-        _ = token == 10.0  # Comparison with a float, not a Quote instance
+    assert not (token == 10.0)  # Comparison with a float, not a Quote instance
+    assert token != 10.0
+    assert token == token
+    assert token == bot_pair.create_token(10.0)
 
 
 def test_quote_get_child_class(bot_pair):
@@ -111,3 +144,11 @@ def test_quote_to_json(bot_pair):
     """Test conversion of Quote (via Token) to JSON."""
     token = bot_pair.create_token(1.234)
     assert json.loads(token.to_json()) == {"price": "1.23400"}
+
+
+def test_quote_sign_matches_predicates(bot_pair):
+    """Test that sign() agrees with is_positive, is_zero and is_negative."""
+    for value in (1.5, 0, -2, "-0"):
+        token = bot_pair.create_token(value)
+        assert token.sign() == (1 if token.is_positive() else -1 if token.is_negative() else 0)
+    assert bot_pair.create_token("-0").sign() == 0
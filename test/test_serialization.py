@@ -59,6 +59,20 @@ class TestDecimalSerialization:
         amount_decimal = Decimal(data["amount"])
         assert amount_decimal == token.amount
 
+    def test_dumps_many_matches_json_dumps(self):
+        """Vérifie que dumps_many produit le même tableau JSON que json.dumps."""
+        from python_trading_objects.quotes import Quote
+
+        pair = BotPair("BTC/EUR")
+        quotes = [
+            pair.create_token(1.5),
+            pair.create_quote_asset(1234.56),
+            pair.create_usd(10),
+            pair.create_price(42000.5),
+        ]
+        assert Quote.dumps_many(quotes) == json.dumps([q.to_dict() for q in quotes])
+        assert Quote.dumps_many([]) == "[]"
+
     def test_precision_preservation_with_very_precise_numbers(self):
         """Vérifie qu'aucune précision n'est perdue avec des nombres très précis."""
         pair = BotPair("ETH/USD")
@@ -114,6 +128,24 @@ class TestDecimalSerialization:
         # Comparaison avec un nombre
         assert token1 < 2.0
 
+    def test_cached_serialization_follows_copies(self):
+        """Vérifie que la sérialisation mise en cache n'est pas reprise par les copies."""
+        pair = BotPair("BTC/USD")
+        token = pair.create_token(1.5)
+        price = pair.create_price(100)
+
+        dumped = token.model_dump()
+        dumped["amount"] = "0"
+        assert token.model_dump()["amount"] == "1.50000"
+        assert token.serialize_model() is not token.serialize_model()
+        assert price.model_dump()["price"] == "100"
+
+        token = token.model_copy(update={"amount": Decimal("2.5")})
+        price = price.model_copy(update={"price": Decimal("200")})
+        assert token.model_dump()["amount"] == "2.5"
+        assert price.model_dump()["price"] == "200"
+        assert pair.create_quote_asset(3).model_dump() == {"amount": "3.00", "precision": 2, "symbol": "USD"}
+
 
 class TestPreparePayloadCompatibility:
     """Tests de compatibilité avec la méthode _prepare_payload."""
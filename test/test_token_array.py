@@ -0,0 +1,78 @@
+"""Unit tests for TokenArray"""
+from decimal import Decimal
+
+import pytest
+
+from python_trading_objects.quotes import AssetArray, BotPair, Token, TokenArray
+
+
+@pytest.fixture
+def bot_pair():
+    return BotPair("BTC/USDT")
+
+
+def test_create_token_array_truncates_like_tokens(bot_pair):
+    """Test that amounts are truncated to the Token precision."""
+    amounts = bot_pair.create_token_array([0.123456789, 2, "1.5"])
+    assert isinstance(amounts, TokenArray)
+    assert amounts.base_symbol == "BTC"
+    assert amounts.values == [bot_pair.create_token(v).amount for v in (0.123456789, 2, "1.5")]
+    assert amounts[0] == bot_pair.create_token(0.123456789)
+
+
+def test_token_array_sum_and_add(bot_pair):
+    """Test reductions and element-wise addition."""
+    amounts = bot_pair.create_token_array([0.1, 0.2])
+    assert amounts.sum() == bot_pair.create_token(0.3)
+    assert (amounts + amounts).values == [Decimal("0.20000"), Decimal("0.40000")]
+    assert bot_pair.create_token_array([]).sum().amount == 0
+    with pytest.raises(ValueError):
+        amounts + TokenArray([1, 2], "ETH")
+
+
+def test_token_array_mark_to_market(bot_pair):
+    """Test that valuation matches Price * Token element by element."""
+    tokens = [bot_pair.create_token(v) for v in (0.12345, 1, 0.5)]
+    amounts = TokenArray.from_tokens(tokens)
+
+    price = bot_pair.create_price(51234.567)
+    values = amounts.mark_to_market(price)
+    assert isinstance(values, AssetArray) and values.symbol == "USDT"
+    assert list(values.to_assets()) == [price * t for t in tokens]
+
+    prices = bot_pair.create_price_array([100.5, 200.25, 3])
+    assert values.symbol == amounts.mark_to_market(prices).symbol
+    assert amounts.mark_to_market(prices).values == [(p * t).amount for p, t in zip(prices.to_prices(), tokens)]
+
+    with pytest.raises(ValueError):
+        amounts.mark_to_market(BotPair("ETH/USDT").create_price(1))
+    with pytest.raises(ValueError):
+        amounts.mark_to_market(bot_pair.create_price_array([1]))
+
+
+def test_token_array_mul_operators(bot_pair):
+    """Test that TokenArray * Price and PriceArray * TokenArray value the series."""
+    amounts = bot_pair.create_token_array([0.5, 2])
+    prices = bot_pair.create_price_array([100.5, 3])
+    assert (prices * amounts).values == amounts.mark_to_market(prices).values == [Decimal("50.25"), Decimal("6.00")]
+    assert (amounts * bot_pair.create_price(10)).values == [Decimal("5.00"), Decimal("20.00")]
+    with pytest.raises(TypeError):
+        amounts * 2
+
+
+def test_token_array_round_trip(bot_pair):
+    """Test conversion from and to Token instances."""
+    tokens = [bot_pair.create_token(v) for v in (1, 2)]
+    assert list(TokenArray.from_tokens(tokens).to_tokens()) == tokens
+    assert all(isinstance(t, Token) for t in TokenArray.from_tokens(tokens).to_tokens())
+    with pytest.raises(ValueError):
+        TokenArray.from_tokens([])
+
+
+def test_token_array_validates_base_symbol():
+    """Test that the base symbol is normalized like PriceArray symbols and checked."""
+    assert TokenArray([1], "btc").base_symbol == "BTC"
+    assert TokenArray([1], "btc").base_symbol is TokenArray([2], "BTC").base_symbol
+    for symbol in ("btc/usd", "", None):
+        with pytest.raises(ValueError):
+            TokenArray([1], symbol)
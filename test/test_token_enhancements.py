@@ -75,6 +75,29 @@ class TestTokenEnhancements:
         total = float(first.amount) + float(second.amount)
         assert abs(total - 1.0) < 0.0001
 
+    def test_split_conserves_amount(self, bot_pair):
+        """Test that both parts add up exactly to the original amount"""
+        token = bot_pair.create_token(Decimal("1.00001"))
+
+        first, second = token.split(0.5)
+
+        assert first.amount == Decimal("0.50000")
+        assert second.amount == Decimal("0.50001")
+        assert first + second == token
+
+    def test_split_many_matches_split(self, bot_pair):
+        """Test that batch splitting gives the same parts as split()"""
+        tokens = [bot_pair.create_token(v) for v in (1.0, 0.123456, 42)]
+        ratios = [0.3, 0.5, 1.0]
+
+        parts = Token.split_many(tokens, ratios)
+
+        assert parts == [t.split(r) for t, r in zip(tokens, ratios)]
+        with pytest.raises(ValueError, match="ratio must be between 0 and 1"):
+            Token.split_many(tokens, [0.3, 0.5, 1.5])
+        with pytest.raises(ValueError, match="same length"):
+            Token.split_many(tokens, [0.3])
+
     def test_split_all_to_first(self, bot_pair):
         """Test split with ratio 1.0 (all to first)"""
         token = bot_pair.create_token(1.0)
@@ -1,5 +1,8 @@
 """Unit tests for TradingPosition domain model"""
+import sys
+from dataclasses import FrozenInstanceError, asdict, fields
 from datetime import datetime
+from decimal import Decimal
 
 import pytest
 
@@ -77,6 +80,15 @@ class TestTradingPosition:
         expected_profit = 55000 * 0.1 - 50000 * 0.1
         assert abs(float(profit.amount) - expected_profit) < 0.01
 
+    def test_calculate_profit_truncates_each_value(self, sample_position, bot_pair):
+        """Test that profit is the difference of the two truncated values"""
+        sale_price = bot_pair.create_price(Decimal("51234.5678"))
+        profit = sample_position.calculate_profit(sale_price)
+
+        tokens = sample_position.number_of_tokens
+        assert profit == sale_price * tokens - sample_position.purchase_price * tokens
+        assert profit.amount == Decimal("123.45")
+
     def test_calculate_gross_value(self, sample_position, bot_pair):
         """Test gross value calculation"""
         current_price = bot_pair.create_price(52000)
@@ -101,6 +113,36 @@ class TestTradingPosition:
         roi = sample_position.potential_roi
         assert abs(roi - 2.0) < 0.01
 
+    def test_derived_values_are_cached(self, sample_position, bot_pair):
+        """Test that derived values are computed once and not shared with adjusted copies"""
+        assert sample_position.cost_basis is sample_position.cost_basis
+        assert sample_position.potential_profit is sample_position.potential_profit
+
+        updated_position = sample_position.adjust_expected_sale_price(bot_pair.create_price(52000))
+        assert abs(float(updated_position.potential_profit.amount) - 200) < 0.01
+        assert abs(float(sample_position.potential_profit.amount) - 100) < 0.01
+
+    def test_position_is_immutable(self, sample_position, bot_pair):
+        """Test that fields cannot be reassigned"""
+        with pytest.raises(FrozenInstanceError):
+            sample_position.expected_sale_price = bot_pair.create_price(52000)
+
+    def test_derived_value_caches_are_not_fields(self, sample_position):
+        """Test that the cached derived values do not show up as dataclass fields"""
+        names = [
+            'id', 'pair', 'purchase_price', 'number_of_tokens', 'expected_sale_price',
+            'next_purchase_price', 'variations', 'strategy_tag', 'short_id', 'timestamp', 'notes',
+        ]
+        sample_position.cost_basis, sample_position.potential_profit, sample_position.potential_roi
+        assert [f.name for f in fields(TradingPosition)] == names
+        assert list(asdict(sample_position)) == names
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_position_has_no_instance_dict(self, sample_position):
+        """Test that positions use slots instead of a per-instance __dict__"""
+        assert not hasattr(sample_position, '__dict__')
+        assert sample_position.cost_basis is sample_position.cost_basis
+
     def test_should_sell_at(self, sample_position, bot_pair):
         """Test sell condition check"""
         # Price above expected sale price
@@ -170,6 +212,13 @@ class TestTradingPosition:
         same_position = sample_position.apply_trailing_stop(low_price, 0.02)
         assert float(same_position.expected_sale_price.price) == 51000
 
+    def test_apply_trailing_stop_exact_factor(self, sample_position, bot_pair):
+        """Test that the trailing factor is the exact decimal of 1 - trail_pct"""
+        high_price = bot_pair.create_price(55000)
+        for _ in range(2):  # second call goes through the memoized factor
+            updated_position = sample_position.apply_trailing_stop(high_price, 0.02)
+            assert updated_position.expected_sale_price.price == Decimal("53900")
+
     def test_to_dict(self, sample_position):
         """Test serialization to dictionary"""
         data = sample_position.to_dict()
@@ -117,6 +117,18 @@ def test_usd_truediv_by_float(bot_pair):
     assert result.get_quote() == "USD"
 
 
+def test_usd_truediv_results_are_truncated(bot_pair):
+    """Test that division results keep the class and the truncation of the constructor."""
+    result = bot_pair.create_usd(100.0) / 3
+    assert isinstance(result, USD)
+    assert result.amount == Decimal("33.33")
+    assert result.precision == 2
+
+    tokens = bot_pair.create_usd(100.0) / bot_pair.create_price(3.0)
+    assert tokens.amount == Decimal("33.33333")
+    assert tokens == bot_pair.create_token(Decimal(100) / Decimal(3))
+
+
 def test_usd_truediv_by_usd(bot_pair):
     """Test division of a USD by another USD."""
     usd1 = bot_pair.create_usd(100.0)